@@ -7,6 +7,7 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from apps.assignments.models import Assignment, AssignmentHistory, SwapRequest
 from apps.scheduling.models import ShiftTemplate, ShiftInstance, PlanningPeriod
+from .fields import EuropeanDateField, EuropeanDateTimeField
 
 User = get_user_model()
 
@@ -140,7 +141,7 @@ class SwapRequestSerializer(serializers.ModelSerializer):
     approved_by = serializers.StringRelatedField(read_only=True)
     
     # Custom datetime field with multiple format support
-    expires_at = serializers.DateTimeField(
+    expires_at = EuropeanDateTimeField(
         input_formats=[
             '%Y-%m-%dT%H:%M',      # HTML datetime-local format
             '%d/%m/%Y %H:%M',      # DD/MM/YYYY format
@@ -230,8 +231,8 @@ class PlanningRequestSerializer(serializers.Serializer):
     """Serializer for planning generation requests"""
     
     team_id = serializers.IntegerField()
-    start_date = serializers.DateField()
-    end_date = serializers.DateField()
+    start_date = EuropeanDateField()
+    end_date = EuropeanDateField()
     algorithm = serializers.ChoiceField(
         choices=[
             ('balanced', 'Balanced Distribution'),
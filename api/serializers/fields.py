@@ -0,0 +1,35 @@
+"""
+TPS V1.4 - Serializer Fields
+Date fields that parse the preferred European input format without strptime
+"""
+
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+from core.fast_dateparse import (
+    DATE_FORMAT, DATETIME_FORMAT, parse_date_fast, parse_datetime_fast
+)
+
+
+class EuropeanDateField(serializers.DateField):
+    """DateField with a fast path for DD/MM/YYYY; other input uses the configured formats"""
+
+    def to_internal_value(self, value):
+        input_formats = getattr(self, 'input_formats', api_settings.DATE_INPUT_FORMATS)
+        if isinstance(value, str) and DATE_FORMAT in input_formats:
+            parsed = parse_date_fast(value)
+            if parsed is not None:
+                return parsed
+        return super().to_internal_value(value)
+
+
+class EuropeanDateTimeField(serializers.DateTimeField):
+    """DateTimeField with a fast path for DD/MM/YYYY HH:MM; other input uses the configured formats"""
+
+    def to_internal_value(self, value):
+        input_formats = getattr(self, 'input_formats', api_settings.DATETIME_INPUT_FORMATS)
+        if isinstance(value, str) and DATETIME_FORMAT in input_formats:
+            parsed = parse_datetime_fast(value)
+            if parsed is not None:
+                return self.enforce_timezone(parsed)
+        return super().to_internal_value(value)
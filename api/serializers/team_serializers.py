@@ -6,6 +6,7 @@ Django REST Framework serializers for team management
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from apps.teams.models import Team, TeamRole, TeamMembership, TeamScheduleTemplate
+from .fields import EuropeanDateField
 
 User = get_user_model()
 
@@ -85,13 +86,13 @@ class TeamWorkloadSerializer(serializers.Serializer):
     ytd_weeks_waakdienst = serializers.IntegerField()
     ytd_weeks_incident = serializers.IntegerField()
     fairness_score = serializers.DecimalField(max_digits=5, decimal_places=2)
-    next_availability = serializers.DateField(allow_null=True)
+    next_availability = EuropeanDateField(allow_null=True)
 
 
 class TeamScheduleSerializer(serializers.Serializer):
     """Serializer for team schedule data"""
     
-    date = serializers.DateField()
+    date = EuropeanDateField()
     assignments = serializers.ListField(
         child=serializers.DictField(),
         required=False
@@ -222,8 +223,8 @@ class AddTeamMemberSerializer(serializers.Serializer):
 class TeamPlanningDataSerializer(serializers.Serializer):
     """Serializer for team planning data"""
     
-    planning_period_start = serializers.DateField()
-    planning_period_end = serializers.DateField()
+    planning_period_start = EuropeanDateField()
+    planning_period_end = EuropeanDateField()
     total_shifts_needed = serializers.IntegerField()
     total_hours_needed = serializers.DecimalField(max_digits=10, decimal_places=2)
     available_members = serializers.ListField(
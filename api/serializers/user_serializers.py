@@ -6,6 +6,7 @@ Django REST Framework serializers for user management
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from apps.accounts.models import Skill, UserSkill, SkillCategory
+from .fields import EuropeanDateField, EuropeanDateTimeField
 
 User = get_user_model()
 
@@ -63,11 +64,11 @@ class UserStatisticsSerializer(serializers.Serializer):
 class UserScheduleSerializer(serializers.Serializer):
     """Serializer for user schedule data"""
     
-    date = serializers.DateField()
+    date = EuropeanDateField()
     shift_type = serializers.CharField()
     shift_name = serializers.CharField()
-    start_datetime = serializers.DateTimeField()
-    end_datetime = serializers.DateTimeField()
+    start_datetime = EuropeanDateTimeField()
+    end_datetime = EuropeanDateTimeField()
     location = serializers.CharField()
     status = serializers.CharField()
     assignment_id = serializers.IntegerField()
@@ -97,6 +97,10 @@ class User(AbstractUser):
         db_table = 'tps_users'
         verbose_name = 'TPS User'
         verbose_name_plural = 'TPS Users'
+        indexes = [
+            # Active-user listings that filter or exclude by username
+            models.Index(fields=['is_active', 'username'], name='idx_user_active_username'),
+        ]
         
     def __str__(self):
         return f"{self.get_full_name()} ({self.employee_id})"
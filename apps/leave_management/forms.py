@@ -8,6 +8,8 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 from datetime import date, timedelta
 
+from core.form_fields import EuropeanDateField
+
 from .models import LeaveType, LeaveRequest, RecurringLeave, LeaveBalance
 
 
@@ -20,6 +22,10 @@ class LeaveRequestForm(forms.ModelForm):
             'leave_type', 'start_date', 'end_date', 'request_type',
             'start_time', 'end_time', 'hours_requested', 'reason'
         ]
+        field_classes = {
+            'start_date': EuropeanDateField,
+            'end_date': EuropeanDateField,
+        }
         widgets = {
             'start_date': forms.DateInput(
                 attrs={
@@ -163,6 +169,10 @@ class RecurringLeaveForm(forms.ModelForm):
             'auto_create_requests', 'advance_creation_days', 'skip_holidays',
             'notes'
         ]
+        field_classes = {
+            'start_date': EuropeanDateField,
+            'end_date': EuropeanDateField,
+        }
         widgets = {
             'start_date': forms.DateInput(
                 attrs={
@@ -397,7 +407,7 @@ class LeaveTypeFilterForm(forms.Form):
         )
     )
     
-    date_from = forms.DateField(
+    date_from = EuropeanDateField(
         required=False,
         widget=forms.DateInput(
             attrs={
@@ -407,7 +417,7 @@ class LeaveTypeFilterForm(forms.Form):
         )
     )
     
-    date_to = forms.DateField(
+    date_to = EuropeanDateField(
         required=False,
         widget=forms.DateInput(
             attrs={
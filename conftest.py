@@ -1,6 +1,7 @@
 """
 Simple test configuration for TPS
 """
+import factory
 import pytest
 
 
@@ -49,4 +50,105 @@ def test_team(db):
         max_members_per_shift=3,
         preferred_team_size=8,
         is_active=True
-    )
\ No newline at end of file
+    )
+
+@pytest.fixture
+def mock_team():
+    """In-memory team stand-in for service constructor tests (no DB access)"""
+    from unittest.mock import Mock
+    from apps.teams.models import Team
+    team = Mock(spec=Team)
+    team.name = 'Mock Engineering Team'
+    team.get_active_members.return_value = []
+    return team
+
+
+# Model factories
+
+class UserFactory(factory.django.DjangoModelFactory):
+    """Factory for TPS users"""
+    class Meta:
+        model = 'accounts.User'
+        django_get_or_create = ('username',)
+
+    username = factory.Sequence(lambda n: f'engineer_{n}')
+    email = factory.LazyAttribute(lambda o: f'{o.username}@test.com')
+    employee_id = factory.Sequence(lambda n: f'EMP_{n:04d}')
+    role = 'USER'
+    password = factory.PostGenerationMethodCall('set_password', 'testpass123')
+
+
+class TeamFactory(factory.django.DjangoModelFactory):
+    """Factory for teams"""
+    class Meta:
+        model = 'teams.Team'
+        django_get_or_create = ('name',)
+
+    name = factory.Sequence(lambda n: f'Engineering Team {n}')
+    department = 'Engineering'
+    is_active = True
+
+
+class TeamRoleFactory(factory.django.DjangoModelFactory):
+    """Factory for team roles (positions within a team)"""
+    class Meta:
+        model = 'teams.TeamRole'
+        django_get_or_create = ('name',)
+
+    name = 'operationeel'
+
+
+class SkillCategoryFactory(factory.django.DjangoModelFactory):
+    """Factory for skill categories"""
+    class Meta:
+        model = 'accounts.SkillCategory'
+        django_get_or_create = ('name',)
+
+    name = 'Operations'
+
+
+class SkillFactory(factory.django.DjangoModelFactory):
+    """Factory for skills"""
+    class Meta:
+        model = 'accounts.Skill'
+        django_get_or_create = ('name',)
+
+    name = factory.Sequence(lambda n: f'Skill {n}')
+    category = factory.SubFactory(SkillCategoryFactory)
+    is_active = True
+
+
+@pytest.fixture
+def skill_waakdienst(db):
+    """Waakdienst skill"""
+    return SkillFactory(name='Waakdienst')
+
+
+@pytest.fixture
+def skill_incident(db):
+    """Incident skill"""
+    return SkillFactory(name='Incident')
+
+
+@pytest.fixture
+def team_role(db):
+    """Operationeel team position"""
+    return TeamRoleFactory(name='operationeel')
+
+
+@pytest.fixture
+def team(db):
+    """Active team"""
+    return TeamFactory()
+
+
+@pytest.fixture
+def user_factory(db):
+    """UserFactory, for tests that build their own users"""
+    return UserFactory
+
+
+@pytest.fixture
+def team_factory(db):
+    """TeamFactory, for tests that build their own teams"""
+    return TeamFactory
@@ -7,10 +7,24 @@ class CoreConfig(AppConfig):
     name = 'core'
     
     def ready(self):
-        """Override Django formats when the app is ready."""
-        # Force European date/time formats
-        settings.DATE_FORMAT = 'd/m/Y'
-        settings.TIME_FORMAT = 'H:i'
-        settings.DATETIME_FORMAT = 'd/m/Y H:i'
-        settings.SHORT_DATE_FORMAT = 'd/m/Y'
-        settings.SHORT_DATETIME_FORMAT = 'd/m/Y H:i'
+        """Override Django formats and host validation when the app is ready."""
+        from django.utils import translation
+
+        from .formats import EUROPEAN_FORMATS, force_european_formats
+        from .hosts import install_fast_host_validation
+
+        # Force European date/time formats once per process instead of per request
+        for name, value in EUROPEAN_FORMATS.items():
+            setattr(settings, name, value)
+        force_european_formats()
+
+        # Exact ALLOWED_HOSTS entries are checked with a set lookup
+        install_fast_host_validation()
+
+        # Load the translation catalog at startup rather than on the first
+        # request each worker serves; override() restores the thread's language
+        with translation.override(settings.LANGUAGE_CODE):
+            translation.gettext('')
+
+        # Connect cache invalidation receivers
+        from . import signals  # noqa: F401
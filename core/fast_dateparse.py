@@ -0,0 +1,53 @@
+"""
+Fast parsing of the preferred DD/MM/YYYY [HH:MM] input formats
+
+Checks the fixed layout by position and builds the value directly, so the common
+case skips datetime.strptime. Anything else returns None and the caller falls
+back to its regular input formats. ISO dates (what <input type="date"> submits)
+get the same treatment.
+"""
+from datetime import date, datetime
+
+DATE_FORMAT = '%d/%m/%Y'
+DATETIME_FORMAT = '%d/%m/%Y %H:%M'
+ISO_DATE_FORMAT = '%Y-%m-%d'
+
+
+def parse_date_fast(value):
+    """Parse 'DD/MM/YYYY' into a date; None if the string has another shape"""
+    if len(value) != 10 or value[2] != '/' or value[5] != '/':
+        return None
+    day, month, year = value[0:2], value[3:5], value[6:10]
+    if not (day.isdigit() and month.isdigit() and year.isdigit()):
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def parse_datetime_fast(value):
+    """Parse 'DD/MM/YYYY HH:MM' into a naive datetime; None if the string has another shape"""
+    if len(value) != 16 or value[10] != ' ' or value[13] != ':':
+        return None
+    parsed_date = parse_date_fast(value[:10])
+    hour, minute = value[11:13], value[14:16]
+    if parsed_date is None or not (hour.isdigit() and minute.isdigit()):
+        return None
+    try:
+        return datetime(parsed_date.year, parsed_date.month, parsed_date.day, int(hour), int(minute))
+    except ValueError:
+        return None
+
+
+def parse_iso_date_fast(value):
+    """Parse 'YYYY-MM-DD' into a date; None if the string has another shape"""
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        return None
+    year, month, day = value[0:4], value[5:7], value[8:10]
+    if not (day.isdigit() and month.isdigit() and year.isdigit()):
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
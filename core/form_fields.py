@@ -0,0 +1,29 @@
+"""
+Form fields that parse the common date inputs without strptime
+"""
+from django import forms
+
+from .fast_dateparse import DATE_FORMAT, ISO_DATE_FORMAT, parse_date_fast, parse_iso_date_fast
+
+
+class EuropeanDateField(forms.DateField):
+    """
+    DateField with fast paths for DD/MM/YYYY and ISO YYYY-MM-DD
+
+    Django tries each DATE_INPUT_FORMATS entry with strptime in turn, and ISO
+    (sent by <input type="date">) is the last one. Values that match neither
+    fast path, or whose format isn't in input_formats, use the normal parsing.
+    """
+
+    def to_python(self, value):
+        if isinstance(value, str):
+            stripped = value.strip()
+            if DATE_FORMAT in self.input_formats:
+                parsed = parse_date_fast(stripped)
+                if parsed is not None:
+                    return parsed
+            if ISO_DATE_FORMAT in self.input_formats:
+                parsed = parse_iso_date_fast(stripped)
+                if parsed is not None:
+                    return parsed
+        return super().to_python(value)
@@ -0,0 +1,28 @@
+"""
+European date/time formats applied process-wide
+"""
+from django.utils import formats
+
+EUROPEAN_FORMATS = {
+    'DATE_FORMAT': 'd/m/Y',
+    'TIME_FORMAT': 'H:i',
+    'DATETIME_FORMAT': 'd/m/Y H:i',
+    'SHORT_DATE_FORMAT': 'd/m/Y',
+    'SHORT_DATETIME_FORMAT': 'd/m/Y H:i',
+}
+
+
+def force_european_formats():
+    """Patch Django's format lookup to return European formats; safe to call more than once."""
+    if getattr(formats.get_format, 'forces_european_formats', False):
+        return
+    original_get_format = formats.get_format
+
+    def get_format(format_type, lang=None, use_l10n=None):
+        if format_type in EUROPEAN_FORMATS:
+            return EUROPEAN_FORMATS[format_type]
+        # Fall back to the original function for other formats
+        return original_get_format(format_type, lang, use_l10n)
+
+    get_format.forces_european_formats = True
+    formats.get_format = get_format
@@ -6,11 +6,14 @@ from django.http import JsonResponse
 from django.db import connections
 from django.core.cache import cache
 from django.conf import settings
-import redis
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_safe
 import logging
 
 logger = logging.getLogger(__name__)
 
+@never_cache
+@require_safe
 def health_check(request):
     """
     Comprehensive health check endpoint for load balancers and monitoring
@@ -45,6 +48,8 @@ def health_check(request):
     
     # Check Redis connectivity (if configured)
     try:
+        # Imported here so loading the URLconf doesn't pull in the redis client
+        import redis
         redis_host = getattr(settings, 'REDIS_HOST', 'localhost')
         redis_port = getattr(settings, 'REDIS_PORT', 6379)
         r = redis.Redis(host=redis_host, port=redis_port, socket_timeout=5)
@@ -82,6 +87,8 @@ def health_check(request):
     
     return JsonResponse(status)
 
+@never_cache
+@require_safe
 def readiness_check(request):
     """
     Readiness check for Kubernetes/container orchestration
@@ -99,6 +106,8 @@ def readiness_check(request):
         logger.error(f"Readiness check failed: {e}")
         return JsonResponse({'status': 'not_ready', 'error': str(e)}, status=503)
 
+@never_cache
+@require_safe
 def liveness_check(request):
     """
     Liveness check for Kubernetes/container orchestration
@@ -109,6 +118,8 @@ def liveness_check(request):
         'timestamp': __import__('time').time()
     })
 
+@never_cache
+@require_safe
 def metrics_endpoint(request):
     """
     Basic metrics endpoint for monitoring integration
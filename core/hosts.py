@@ -0,0 +1,35 @@
+"""
+Set-based fast path for Django's ALLOWED_HOSTS validation
+"""
+import functools
+
+from django.http import request as http_request
+
+
+@functools.lru_cache(maxsize=8)
+def _split_allowed_hosts(allowed_hosts):
+    """Split host patterns into exact names (lower-cased) and the remaining wildcard patterns"""
+    exact = frozenset(
+        pattern.lower() for pattern in allowed_hosts
+        if pattern and pattern != '*' and not pattern.startswith('.')
+    )
+    wildcards = tuple(
+        pattern for pattern in allowed_hosts
+        if pattern == '*' or pattern.startswith('.')
+    )
+    return exact, wildcards
+
+
+def install_fast_host_validation():
+    """Answer exact host matches with one set lookup; safe to call more than once."""
+    if getattr(http_request.validate_host, 'uses_host_set', False):
+        return
+    original_validate_host = http_request.validate_host
+
+    def validate_host(host, allowed_hosts):
+        # settings.ALLOWED_HOSTS is a tuple, so the split is cached per settings value
+        exact, wildcards = _split_allowed_hosts(tuple(allowed_hosts))
+        return host in exact or original_validate_host(host, wildcards)
+
+    validate_host.uses_host_set = True
+    http_request.validate_host = validate_host
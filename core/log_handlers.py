@@ -0,0 +1,54 @@
+"""
+Logging handlers for TPS
+Moves log file writes off the request thread
+"""
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+class QueuedFileHandler(QueueHandler):
+    """
+    File handler whose writes happen on a background QueueListener thread
+
+    Records are formatted with this handler's formatter and queued; the
+    listener appends them to the file. The listener starts on the first
+    record in each process, so forked workers get their own thread.
+    """
+
+    def __init__(self, filename, mode='a', encoding=None, delay=False):
+        super().__init__(queue.SimpleQueue())
+        # Set up the listener state first: if the file can't be opened, logging
+        # still calls close() on this half-built handler at shutdown
+        self.file_handler = None
+        self._listener = None
+        self._listener_pid = None
+        self._listener_lock = threading.Lock()
+        self.file_handler = logging.FileHandler(filename, mode=mode, encoding=encoding, delay=delay)
+
+    def _ensure_listener(self):
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        with self._listener_lock:
+            if self._listener_pid != pid:
+                self._listener = QueueListener(self.queue, self.file_handler)
+                self._listener.start()
+                self._listener_pid = pid
+
+    def emit(self, record):
+        self._ensure_listener()
+        super().emit(record)
+
+    def close(self):
+        # Drain queued records into the file before closing it
+        with self._listener_lock:
+            if self._listener is not None and self._listener_pid == os.getpid():
+                self._listener.stop()
+            self._listener = None
+            self._listener_pid = None
+        if self.file_handler is not None:
+            self.file_handler.close()
+        super().close()
@@ -0,0 +1,24 @@
+"""
+Management command to run the security settings audit
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from tps_project.security_settings import validate_security_settings
+
+
+class Command(BaseCommand):
+    help = 'Audit security-related environment settings (SECRET_KEY, DEBUG, passwords, hosts)'
+
+    def handle(self, *args, **options):
+        security_issues = validate_security_settings()
+        if not security_issues:
+            self.stdout.write(self.style.SUCCESS("🔒 No security audit findings"))
+            return
+
+        self.stdout.write("🔒 SECURITY AUDIT FINDINGS:")
+        for issue in security_issues:
+            style = self.style.ERROR if issue.startswith('CRITICAL') else self.style.WARNING
+            self.stdout.write(style(f"   {issue}"))
+
+        if any(issue.startswith('CRITICAL') for issue in security_issues):
+            raise CommandError("Critical security issues found")
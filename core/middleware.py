@@ -1,42 +1,33 @@
 """
-Middleware to force European date/time formats
+Middleware to answer probe endpoints without URL resolution
 """
-from django.utils import formats
+from .health import health_check, liveness_check, metrics_endpoint, readiness_check
 
 
-class ForceEuropeanFormatsMiddleware:
-    """Middleware that forces European date/time formats."""
-    
+class FastPathMiddleware:
+    """Serve hot, dependency-free endpoints with one dict lookup.
+
+    Health probes and metrics scrapes arrive every few seconds and need no
+    session, user or CSRF handling; matching them here, ahead of those
+    middleware, skips the rest of the chain and the URL resolver.
+    The host is still checked against ALLOWED_HOSTS first, as CommonMiddleware
+    would; a disallowed Host header gets the usual 400 response.
+    The same views stay routed in tps_project.urls for anything that misses.
+    """
+
+    FAST_PATHS = {
+        '/health/': health_check,
+        '/health/ready/': readiness_check,
+        '/health/live/': liveness_check,
+        '/metrics/': metrics_endpoint,
+    }
+
     def __init__(self, get_response):
         self.get_response = get_response
-        
+
     def __call__(self, request):
-        # Monkey patch the format functions to return our formats
-        self._patch_formats()
-        response = self.get_response(request)
-        return response
-    
-    def _patch_formats(self):
-        """Patch Django's format system to use European formats."""
-        # Store original functions if not already stored
-        if not hasattr(self, '_original_get_format'):
-            self._original_get_format = formats.get_format
-            
-        # Override get_format function
-        def custom_get_format(format_type, lang=None, use_l10n=None):
-            format_map = {
-                'DATE_FORMAT': 'd/m/Y',
-                'TIME_FORMAT': 'H:i',
-                'DATETIME_FORMAT': 'd/m/Y H:i',
-                'SHORT_DATE_FORMAT': 'd/m/Y',
-                'SHORT_DATETIME_FORMAT': 'd/m/Y H:i',
-            }
-            
-            if format_type in format_map:
-                return format_map[format_type]
-            
-            # Fall back to original function for other formats
-            return self._original_get_format(format_type, lang, use_l10n)
-        
-        # Apply the patch
-        formats.get_format = custom_get_format
+        view = self.FAST_PATHS.get(request.path_info)
+        if view is not None and request.method in ('GET', 'HEAD'):
+            request.get_host()
+            return view(request)
+        return self.get_response(request)
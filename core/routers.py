@@ -0,0 +1,36 @@
+"""
+Database routers for TPS
+"""
+from django.db import connections
+
+
+class ReplicaRouter:
+    """Send reads for the read-heavy scheduling apps to the 'replica' database.
+
+    Writes, migrations and every other app stay on 'default', and so do reads
+    inside a transaction: they must see the transaction's own writes, which
+    the replica doesn't have. Only installed when a replica is configured
+    (see settings.production).
+    """
+
+    replica_alias = 'replica'
+    replica_app_labels = frozenset({'scheduling', 'assignments'})
+
+    def db_for_read(self, model, **hints):
+        if connections['default'].in_atomic_block:
+            return None
+        if model._meta.app_label in self.replica_app_labels:
+            return self.replica_alias
+        return None
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica mirrors the primary, so rows from either side may be related
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == self.replica_alias:
+            return False
+        return None
@@ -11,6 +11,12 @@ from datetime import datetime, date, timedelta
 
 User = get_user_model()
 
+# Roles allowed through each PermissionService gate
+PLANNING_ROLES = frozenset({'PLANNER', 'MANAGER', 'ADMIN'})
+ANALYTICS_ROLES = frozenset({'MANAGER', 'ADMIN'})
+TEAM_MANAGEMENT_ROLES = frozenset({'MANAGER', 'ADMIN'})
+MANAGER_ROLES = frozenset({'MANAGER', 'ADMIN'})
+
 
 class BaseService(ABC):
     """
@@ -76,17 +82,17 @@ class PermissionService(BaseService):
     @staticmethod
     def can_access_planning(user: User) -> bool:
         """Check if user can access planning tools"""
-        return user.role in ['PLANNER', 'MANAGER', 'ADMIN']
+        return user.role in PLANNING_ROLES
     
     @staticmethod
     def can_access_analytics(user: User) -> bool:
         """Check if user can access analytics dashboard"""
-        return user.role in ['MANAGER', 'ADMIN']
+        return user.role in ANALYTICS_ROLES
     
     @staticmethod
     def can_manage_teams(user: User) -> bool:
         """Check if user can manage teams and users"""
-        return user.role in ['MANAGER', 'ADMIN']
+        return user.role in TEAM_MANAGEMENT_ROLES
     
     @staticmethod
     def is_team_leader(user: User) -> bool:
@@ -94,6 +100,31 @@ class PermissionService(BaseService):
         from apps.teams.models import Team
         return Team.objects.filter(team_leader=user).exists()
     
+    @classmethod
+    def get_all(cls, user: User) -> Dict[str, bool]:
+        """
+        Get all role-based permissions for a user, memoized on the instance
+        
+        The result lives as long as the user object (one request for
+        request.user) and is recomputed if the user's role changes. It is not
+        stored on _perm_cache, which Django's ModelBackend uses for has_perm.
+        """
+        cached = getattr(user, '_tps_permissions', None)
+        if cached is not None and cached[0] == user.role:
+            return cached[1]
+        
+        permissions = {
+            'can_access_planning': cls.can_access_planning(user),
+            'can_access_analytics': cls.can_access_analytics(user),
+            'can_manage_teams': cls.can_manage_teams(user),
+            'is_team_leader': cls.is_team_leader(user),
+            'is_planner': user.role in PLANNING_ROLES,
+            'is_manager': user.role in MANAGER_ROLES,
+            'is_admin': user.role == 'ADMIN',
+        }
+        user._tps_permissions = (user.role, permissions)
+        return permissions
+    
     @staticmethod
     def get_user_teams(user: User, include_led_teams: bool = True):
         """Get teams the user belongs to or leads"""
@@ -104,4 +135,4 @@ class PermissionService(BaseService):
         if include_led_teams:
             query |= Q(team_leader=user)
         
-        return Team.objects.filter(query).distinct()
\ No newline at end of file
+        return Team.objects.filter(query).select_related('team_leader').distinct()
\ No newline at end of file
@@ -3,7 +3,7 @@ TPS V1.4 - Cache Service Layer
 Centralized caching for performance optimization
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List
 from django.core.cache import cache
 from django.conf import settings
 from django.db.models import Model
@@ -21,8 +21,13 @@ class CacheService:
     # Cache timeouts (in seconds)
     USER_PERMISSIONS_TIMEOUT = 300      # 5 minutes
     DASHBOARD_DATA_TIMEOUT = 180        # 3 minutes
+    DASHBOARD_CONTEXT_TIMEOUT = 60      # 1 minute
     TEAM_MEMBERSHIPS_TIMEOUT = 600      # 10 minutes
     SYSTEM_STATS_TIMEOUT = 120          # 2 minutes
+    QUALIFIED_ENGINEERS_TIMEOUT = 300   # 5 minutes
+    
+    # Skills the planning services qualify engineers by
+    QUALIFICATION_SKILLS = ('Waakdienst', 'Incident')
     
     @classmethod
     def _make_cache_key(cls, *parts) -> str:
@@ -69,31 +74,43 @@ class CacheService:
         cache_key = cls._make_cache_key('user_teams', user_id)
         cache.delete(cache_key)
     
+    @classmethod
+    def _make_dashboard_key(cls, user_id: int, dashboard_type: str) -> str:
+        """Create a dashboard cache key under the user's current generation"""
+        generation = cache.get(cls._make_cache_key('dashboard_generation', user_id), 0)
+        return cls._make_cache_key('dashboard', user_id, generation, dashboard_type)
+    
     @classmethod
     def get_dashboard_data(cls, user_id: int, dashboard_type: str) -> Optional[Dict[str, Any]]:
         """Get cached dashboard data"""
-        cache_key = cls._make_cache_key('dashboard', user_id, dashboard_type)
-        return cache.get(cache_key)
+        return cache.get(cls._make_dashboard_key(user_id, dashboard_type))
     
     @classmethod
-    def set_dashboard_data(cls, user_id: int, dashboard_type: str, data: Dict[str, Any]) -> None:
+    def set_dashboard_data(cls, user_id: int, dashboard_type: str, data: Dict[str, Any],
+                           timeout: Optional[int] = None) -> None:
         """Cache dashboard data"""
-        cache_key = cls._make_cache_key('dashboard', user_id, dashboard_type)
-        cache.set(cache_key, data, cls.DASHBOARD_DATA_TIMEOUT)
+        cache_key = cls._make_dashboard_key(user_id, dashboard_type)
+        cache.set(cache_key, data, timeout or cls.DASHBOARD_DATA_TIMEOUT)
     
     @classmethod
-    def invalidate_dashboard_data(cls, user_id: int = None, dashboard_type: str = None) -> None:
-        """Invalidate dashboard cache (specific user or all)"""
-        if user_id and dashboard_type:
-            cache_key = cls._make_cache_key('dashboard', user_id, dashboard_type)
-            cache.delete(cache_key)
-        else:
-            # Clear all dashboard cache - use pattern if available
-            if hasattr(cache, 'delete_pattern'):
-                cache.delete_pattern('tps:dashboard:*')
-            else:
-                # Fallback: clear entire cache (not ideal but works)
-                cache.clear()
+    def invalidate_dashboard_data(cls, user_id: int, dashboard_type: str = None) -> None:
+        """Invalidate one of a user's dashboards, or all of them"""
+        if dashboard_type:
+            cache.delete(cls._make_dashboard_key(user_id, dashboard_type))
+            return
+        # Not every backend can find a user's keys by pattern, so move the user
+        # to a new generation instead; the old entries expire on their own
+        generation_key = cls._make_cache_key('dashboard_generation', user_id)
+        try:
+            cache.incr(generation_key)
+        except ValueError:
+            cache.add(generation_key, 1, None)
+    
+    @classmethod
+    def invalidate_dashboards(cls, user_ids: Iterable[int]) -> None:
+        """Invalidate every dashboard of the given users"""
+        for user_id in set(user_ids):
+            cls.invalidate_dashboard_data(user_id)
     
     @classmethod
     def get_system_stats(cls) -> Optional[Dict[str, Any]]:
@@ -113,6 +130,26 @@ class CacheService:
         cache_key = cls._make_cache_key('system_stats')
         cache.delete(cache_key)
     
+    @classmethod
+    def get_qualified_engineer_ids(cls, skill_name: str) -> Optional[frozenset]:
+        """Get cached IDs of the engineers holding a qualification skill"""
+        cache_key = cls._make_cache_key('qualified_engineers', skill_name)
+        return cache.get(cache_key)
+    
+    @classmethod
+    def set_qualified_engineer_ids(cls, skill_name: str, user_ids: frozenset) -> None:
+        """Cache IDs of the engineers holding a qualification skill"""
+        cache_key = cls._make_cache_key('qualified_engineers', skill_name)
+        cache.set(cache_key, user_ids, cls.QUALIFIED_ENGINEERS_TIMEOUT)
+    
+    @classmethod
+    def invalidate_qualified_engineer_ids(cls) -> None:
+        """Invalidate the qualified engineer IDs for every qualification skill"""
+        cache.delete_many([
+            cls._make_cache_key('qualified_engineers', skill_name)
+            for skill_name in cls.QUALIFICATION_SKILLS
+        ])
+    
     @classmethod
     def invalidate_all_user_cache(cls, user_id: int) -> None:
         """Invalidate all cache related to a specific user"""
@@ -164,15 +201,18 @@ class CacheInvalidationService:
         CacheService.invalidate_dashboard_data(user_id)
     
     @classmethod
-    def on_assignment_created_or_updated(cls) -> None:
+    def on_assignment_created_or_updated(cls, user_ids: Iterable[int]) -> None:
         """Handle cache invalidation when assignments change"""
         CacheService.invalidate_system_stats()
-        # Invalidate all dashboard data as assignments affect multiple views
-        CacheService.invalidate_dashboard_data()
+        CacheService.invalidate_dashboards(user_ids)
+    
+    @classmethod
+    def on_user_skill_changed(cls) -> None:
+        """Handle cache invalidation when skills or skill assignments change"""
+        CacheService.invalidate_qualified_engineer_ids()
     
     @classmethod
-    def on_leave_request_changed(cls) -> None:
+    def on_leave_request_changed(cls, user_ids: Iterable[int]) -> None:
         """Handle cache invalidation when leave requests change"""
         CacheService.invalidate_system_stats()
-        # Leave requests affect manager and admin dashboards
-        CacheService.invalidate_dashboard_data()
\ No newline at end of file
+        CacheService.invalidate_dashboards(user_ids)
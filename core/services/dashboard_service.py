@@ -10,6 +10,7 @@ from django.utils import timezone
 from datetime import timedelta
 
 from .base_service import ContextService, PermissionService
+from .cache_service import CacheService
 from apps.teams.models import Team
 from apps.assignments.models import Assignment
 from apps.accounts.models import User
@@ -22,9 +23,17 @@ class DashboardStrategy(ContextService):
     
     @abstractmethod
     def build_context(self) -> Dict[str, Any]:
-        """Build role-specific dashboard context"""
+        """Build role-specific dashboard context (cached; see build_live_context)"""
         pass
     
+    def build_live_context(self) -> Dict[str, Any]:
+        """
+        Build the sections that must reflect every change, such as approval
+        queues and recent activity; these are never cached. The querysets
+        stay lazy, so they only hit the database when rendered.
+        """
+        return {}
+    
     def get_common_stats(self) -> Dict[str, Any]:
         """Get statistics common across dashboard types"""
         return {
@@ -44,10 +53,12 @@ class AdminDashboardStrategy(DashboardStrategy):
         context.update({
             'dashboard_type': 'admin',
             **self._get_system_metrics_optimized(),
-            'recent_activity': self._get_recent_activity(),
         })
         return context
     
+    def build_live_context(self) -> Dict[str, Any]:
+        return {'recent_activity': self._get_recent_activity()}
+    
     def _get_system_metrics_optimized(self) -> Dict[str, Any]:
         """Get system-wide metrics using optimized query service"""
         from core.services.query_optimization_service import QueryOptimizationService
@@ -150,16 +161,22 @@ class ManagerDashboardStrategy(DashboardStrategy):
         context.update(self.get_common_stats())
         
         managed_teams = self._get_managed_teams()
+        team_stats = self._get_team_stats(managed_teams)
         context.update({
             'dashboard_type': 'manager',
             'managed_teams': managed_teams,
-            'total_managed_teams': managed_teams.count(),
-            'pending_approvals': self._get_pending_approvals(managed_teams),
-            'pending_leave_approvals': self._get_pending_leave_approvals(managed_teams),
-            'team_stats': self._get_team_stats(managed_teams),
+            'total_managed_teams': len(team_stats),
+            'team_stats': team_stats,
         })
         return context
     
+    def build_live_context(self) -> Dict[str, Any]:
+        managed_teams = self._get_managed_teams()
+        return {
+            'pending_approvals': self._get_pending_approvals(managed_teams),
+            'pending_leave_approvals': self._get_pending_leave_approvals(managed_teams),
+        }
+    
     def _get_managed_teams(self):
         """Get teams managed by this user"""
         return Team.objects.filter(team_leader=self.user)
@@ -180,41 +197,42 @@ class ManagerDashboardStrategy(DashboardStrategy):
         ).distinct().select_related('user', 'leave_type')[:10]
     
     def _get_team_stats(self, managed_teams) -> List[Dict[str, Any]]:
-        """Get performance stats for managed teams - OPTIMIZED to avoid N+1 queries"""
-        from django.db.models import Count
-        
-        # Get team member counts in single query with annotation
-        team_member_counts = {
-            team.id: team.member_count 
-            for team in managed_teams.annotate(
-                member_count=Count('memberships', filter=Q(
-                    memberships__is_active=True,
-                    memberships__user__is_active_employee=True
-                ))
-            )
-        }
+        """
+        Get performance stats for managed teams in a single query
+
+        Member counts are aggregated on the team rows and this week's
+        assignment counts come from a correlated subquery, so teams and both
+        counts arrive in one round-trip.
+        """
+        from django.db.models import Count, IntegerField, OuterRef, Subquery
+        from django.db.models.functions import Coalesce
         
-        # Get assignment counts in single query with annotation
-        team_assignment_counts = dict(
-            Assignment.objects.filter(
-                shift__planning_period__teams__in=managed_teams,
-                shift__start_datetime__gte=self.week_start,
-                shift__start_datetime__lte=self.week_end
-            ).values('shift__planning_period__teams').annotate(
-                assignment_count=Count('id')
-            ).values_list('shift__planning_period__teams', 'assignment_count')
+        week_assignments = Assignment.objects.filter(
+            shift__planning_period__teams=OuterRef('pk'),
+            shift__start_datetime__gte=self.week_start,
+            shift__start_datetime__lte=self.week_end
+        ).order_by().values('shift__planning_period__teams').annotate(
+            assignment_count=Count('id')
+        ).values('assignment_count')
+        
+        teams = managed_teams.annotate(
+            member_count=Count('memberships', filter=Q(
+                memberships__is_active=True,
+                memberships__user__is_active_employee=True
+            )),
+            week_assignment_count=Coalesce(
+                Subquery(week_assignments, output_field=IntegerField()), 0
+            ),
         )
         
-        # Combine results
-        team_stats = []
-        for team in managed_teams:
-            team_stats.append({
+        return [
+            {
                 'team': team,
-                'members': team_member_counts.get(team.id, 0),
-                'this_week_assignments': team_assignment_counts.get(team.id, 0),
-            })
-        
-        return team_stats
+                'members': team.member_count,
+                'this_week_assignments': team.week_assignment_count,
+            }
+            for team in teams
+        ]
 
 
 class PlannerDashboardStrategy(DashboardStrategy):
@@ -230,12 +248,17 @@ class PlannerDashboardStrategy(DashboardStrategy):
         context.update({
             'dashboard_type': 'planner',
             'planning_periods': self._get_planning_periods(user_teams),
-            'unassigned_shifts': self._get_unassigned_shifts(user_teams),
             'planning_advice': self._generate_planning_advice(user_teams),
-            'recent_planning_activity': self._get_recent_planning_activity(user_teams),
         })
         return context
     
+    def build_live_context(self) -> Dict[str, Any]:
+        user_teams = PermissionService.get_user_teams(self.user)
+        return {
+            'unassigned_shifts': self._get_unassigned_shifts(user_teams),
+            'recent_planning_activity': self._get_recent_planning_activity(user_teams),
+        }
+    
     def _get_planning_periods(self, user_teams):
         """Get planning periods needing attention"""
         from apps.scheduling.models import PlanningPeriod
@@ -318,6 +341,14 @@ class UserDashboardStrategy(DashboardStrategy):
         })
         return context
     
+    def build_live_context(self) -> Dict[str, Any]:
+        # Get leave requests separately (if leave management is available)
+        try:
+            leave_requests = self._get_leave_requests()
+        except ImportError:
+            leave_requests = []
+        return {'my_leave_requests': leave_requests}
+    
     def _get_user_dashboard_data_optimized(self) -> Dict[str, Any]:
         """Get user dashboard data using optimized query service"""
         from core.services.query_optimization_service import QueryOptimizationService
@@ -325,19 +356,12 @@ class UserDashboardStrategy(DashboardStrategy):
         # Use optimized service for user dashboard data
         dashboard_data = QueryOptimizationService.get_user_dashboard_data(self.user)
         
-        # Get leave requests separately (if leave management is available)
-        try:
-            leave_requests = self._get_leave_requests()
-        except ImportError:
-            leave_requests = []
-        
         # Get today's assignments
         daily_assignments = self._get_daily_assignments()
         
         return {
             'upcoming_shifts': dashboard_data['upcoming_shifts'],
             'assignment_stats': dashboard_data['assignment_stats'],
-            'my_leave_requests': leave_requests,
             **daily_assignments,
         }
     
@@ -436,15 +460,34 @@ class DashboardService:
     def get_dashboard_context(cls, user: User) -> Dict[str, Any]:
         """
         Get dashboard context for the given user based on their role
+
+        Built contexts are cached per user and role through CacheService for
+        a minute, and dropped sooner when the user's assignments, leave or
+        teams change. Approval queues and activity lists come from
+        build_live_context() on every call, as do the clock and current user,
+        so actions taken by other users show up immediately.
         """
-        strategy_class = cls.STRATEGIES.get(user.role, UserDashboardStrategy)
-        strategy = strategy_class(user)
-        return strategy.build_context()
+        strategy = cls.get_strategy_for_user(user)
+        cache_type = f"context_{user.role}"
+
+        context = CacheService.get_dashboard_data(user.id, cache_type)
+        if context is None:
+            context = strategy.build_context()
+            CacheService.set_dashboard_data(
+                user.id, cache_type, context, CacheService.DASHBOARD_CONTEXT_TIMEOUT
+            )
+        else:
+            context.update(strategy.get_base_context())
+        context.update(strategy.build_live_context())
+        return context
     
     @classmethod
     def get_strategy_for_user(cls, user: User) -> DashboardStrategy:
         """
         Get the appropriate dashboard strategy for a user
+        
+        Strategies are bound to the user and the current time, so a new
+        instance is built per call; only the role -> class lookup is shared.
         """
         strategy_class = cls.STRATEGIES.get(user.role, UserDashboardStrategy)
         return strategy_class(user)
\ No newline at end of file
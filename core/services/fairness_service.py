@@ -101,34 +101,29 @@ class FairnessService:
         """Calculate penalty for consecutive assignments"""
         penalty = 0.0
         
-        # Check previous week assignments  
+        # Check previous and next week assignments in a single query
         last_week = period_start - timedelta(days=7)
-        previous_assignments = Assignment.objects.filter(
+        next_week = period_start + timedelta(days=7)
+        neighbours = Assignment.objects.filter(
             user=user,
             shift__template__category__name=shift_instance.template.category.name,
-            shift__date__range=[
+            status__in=['confirmed', 'proposed']
+        ).aggregate(
+            previous=Count('id', filter=Q(shift__date__range=[
                 last_week - timedelta(days=3),
                 last_week + timedelta(days=3)
-            ],
-            status__in=['confirmed', 'proposed']
-        ).exists()
-        
-        if previous_assignments:
-            penalty += 100  # Heavy penalty for consecutive weeks
-            
-        # Check next week assignments (for planning ahead)
-        next_week = period_start + timedelta(days=7)
-        next_assignments = Assignment.objects.filter(
-            user=user,
-            shift__template__category__name=shift_instance.template.category.name,
-            shift__date__range=[
+            ])),
+            next=Count('id', filter=Q(shift__date__range=[
                 next_week - timedelta(days=3),
                 next_week + timedelta(days=3)
-            ],
-            status__in=['confirmed', 'proposed']
-        ).exists()
+            ])),
+        )
         
-        if next_assignments:
+        if neighbours['previous']:
+            penalty += 100  # Heavy penalty for consecutive weeks
+            
+        # Next week assignments (for planning ahead)
+        if neighbours['next']:
             penalty += 50  # Moderate penalty for planning consecutive
             
         return penalty
@@ -179,26 +174,18 @@ class FairnessService:
         """Calculate penalty for leave conflicts"""
         penalty = 0.0
         
-        # Check for approved leave requests
-        leave_conflicts = LeaveRequest.objects.filter(
+        # Fetch approved and pending leave covering the date in one query
+        conflict_statuses = set(LeaveRequest.objects.filter(
             user=user,
             start_date__lte=assignment_date,
             end_date__gte=assignment_date,
-            status='APPROVED'
-        ).exists()
+            status__in=['APPROVED', 'pending_confirmation']
+        ).order_by().values_list('status', flat=True).distinct())
         
-        if leave_conflicts:
+        if 'APPROVED' in conflict_statuses:
             penalty += 1000  # Very high penalty for leave conflicts
             
-        # Check for pending leave requests
-        pending_conflicts = LeaveRequest.objects.filter(
-            user=user,
-            start_date__lte=assignment_date,
-            end_date__gte=assignment_date,
-            status='pending_confirmation'
-        ).exists()
-        
-        if pending_conflicts:
+        if 'pending_confirmation' in conflict_statuses:
             penalty += 100  # Moderate penalty for pending leave
             
         return penalty
@@ -235,8 +222,9 @@ class FairnessService:
             status__in=['confirmed', 'proposed']
         ).count()
         
-        if team_users.count() > 0:
-            team_average = total_assignments / team_users.count()
+        team_size = team_users.count()
+        if team_size > 0:
+            team_average = total_assignments / team_size
             
             # Penalty increases with assignments above average
             if user_assignments > team_average:
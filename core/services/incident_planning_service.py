@@ -4,6 +4,7 @@ Business hours incident response planning
 """
 
 import logging
+from functools import cached_property
 from datetime import date, datetime, time, timedelta
 from typing import List, Dict, Any, Optional
 from decimal import Decimal
@@ -17,6 +18,7 @@ from apps.scheduling.models import ShiftTemplate, ShiftInstance
 from apps.assignments.models import Assignment
 
 from .data_structures import PlanningResult, PlanningStatus
+from .cache_service import CacheService
 from .fairness_service import FairnessService
 
 logger = logging.getLogger(__name__)
@@ -36,6 +38,9 @@ class IncidentPlanningService:
     Optional: Standby engineer for same times
     """
 
+    # Simple qualification: engineers need this skill
+    QUALIFICATION_SKILL = "Incident"
+
     def __init__(self, team: Team):
         """Initialize incident planning for a specific team"""
         self.team = team
@@ -50,15 +55,28 @@ class IncidentPlanningService:
         self.qualified_engineers = self._get_qualified_engineers()
         
         logger.info(f"Initialized Incident Planning for {team.name}")
-        logger.info(f"Qualified engineers: {len(self.qualified_engineers)}")
+        logger.info(f"Qualified engineers: {len(self.qualified_engineer_ids)}")
     
+    @cached_property
+    def qualified_engineer_ids(self):
+        """IDs of the qualified engineers, for O(1) membership checks
+
+        Shared through CacheService, so services built for other teams or
+        validation runs don't repeat the qualification query. On a miss the
+        set comes from qualified_engineers, which the planners reuse.
+        """
+        user_ids = CacheService.get_qualified_engineer_ids(self.QUALIFICATION_SKILL)
+        if user_ids is None:
+            user_ids = frozenset(engineer.pk for engineer in self.qualified_engineers)
+            CacheService.set_qualified_engineer_ids(self.QUALIFICATION_SKILL, user_ids)
+        return user_ids
+
     def _get_qualified_engineers(self, exclude_user=None):
         """Get engineers qualified for incident response roles"""
         from apps.accounts.models import User
         
-        # Simple qualification: just need "Incident" skill
         qualified_users = User.objects.filter(
-            user_skills__skill__name="Incident"
+            user_skills__skill__name=self.QUALIFICATION_SKILL
         ).distinct()
         
         if exclude_user:
@@ -84,8 +84,8 @@ class PlanningOrchestrator:
         checks['team'] = self.team is not None and self.team.is_active
 
         # 3. Check qualified engineers
-        incident_engineers = self.incident_service.qualified_engineers
-        waakdienst_engineers = self.waakdienst_service.qualified_engineers
+        incident_engineers = self.incident_service.qualified_engineer_ids
+        waakdienst_engineers = self.waakdienst_service.qualified_engineer_ids
         
         if not incident_engineers:
             errors.append("No engineers qualified for incident shifts")
@@ -322,8 +322,8 @@ class PlanningOrchestrator:
         incident_days = self.incident_service._get_business_days(start_date, weeks)
         
         # Get qualified engineers
-        waakdienst_qualified = self.waakdienst_service.qualified_engineers
-        incident_qualified = self.incident_service.qualified_engineers
+        waakdienst_qualified = self.waakdienst_service.qualified_engineer_ids
+        incident_qualified = self.incident_service.qualified_engineer_ids
         
         return {
             'waakdienst_weeks': len(waakdienst_weeks),
@@ -374,8 +374,8 @@ class PlanningOrchestrator:
         summary = {
             'team_name': self.team.name,
             'total_members': len(team_members),
-            'qualified_waakdienst': len(self.waakdienst_service.qualified_engineers),
-            'qualified_incident': len(self.incident_service.qualified_engineers),
+            'qualified_waakdienst': len(self.waakdienst_service.qualified_engineer_ids),
+            'qualified_incident': len(self.incident_service.qualified_engineer_ids),
             'member_workloads': []
         }
         
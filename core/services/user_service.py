@@ -8,7 +8,7 @@ from django.db.models import QuerySet, Q, Count, Sum
 from django.utils import timezone
 from datetime import timedelta
 
-from .base_service import BaseService
+from .base_service import BaseService, PermissionService
 from apps.accounts.models import User, UserSkill
 from apps.teams.models import Team, TeamMembership
 from apps.assignments.models import Assignment
@@ -54,21 +54,13 @@ class UserService(BaseService):
         """
         return Team.objects.filter(
             Q(memberships__user=user) | Q(team_leader=user)
-        ).distinct()
+        ).select_related('team_leader').distinct()
     
     def get_role_permissions(self, user: User) -> Dict[str, bool]:
         """
         Get user's role-based permissions
         """
-        return {
-            'can_access_planning': user.can_access_planning(),
-            'can_access_analytics': user.can_access_analytics(),
-            'can_manage_teams': user.can_manage_teams(),
-            'is_team_leader': self.is_team_leader(user),
-            'is_planner': user.is_planner(),
-            'is_manager': user.is_manager(),
-            'is_admin': user.is_admin(),
-        }
+        return PermissionService.get_all(user)
     
     def get_recent_assignments(self, user: User, limit: int = 10) -> QuerySet[Assignment]:
         """
@@ -0,0 +1,70 @@
+"""
+TPS V1.4 - Signal Receivers
+Database connection tuning and cache invalidation on model changes
+"""
+
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.accounts.models import Skill, UserSkill
+from apps.assignments.models import Assignment
+from apps.leave_management.models import LeaveRequest
+from apps.teams.models import Team, TeamMembership
+from core.services.cache_service import CacheInvalidationService, CacheService
+
+
+def _with_team_leaders(user_id):
+    """The user plus the leaders of their teams, whose dashboards list the user's approvals"""
+    leader_ids = Team.objects.filter(
+        memberships__user_id=user_id, team_leader__isnull=False
+    ).values_list('team_leader_id', flat=True)
+    return {user_id, *leader_ids}
+
+
+@receiver([post_save, post_delete], sender=TeamMembership)
+def invalidate_membership_cache(sender, instance, **kwargs):
+    """Drop the member's cached teams and dashboards when a membership changes"""
+    CacheInvalidationService.on_team_membership_changed(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=Team)
+def invalidate_team_cache(sender, instance, **kwargs):
+    """Team changes show up on the dashboards of its members and leader"""
+    user_ids = set(instance.memberships.values_list('user_id', flat=True))
+    if instance.team_leader_id:
+        user_ids.add(instance.team_leader_id)
+    CacheService.invalidate_dashboards(user_ids)
+
+
+@receiver([post_save, post_delete], sender=Assignment)
+def invalidate_assignment_cache(sender, instance, **kwargs):
+    """Assignments show up on the assignee's dashboard and their team leaders' approvals"""
+    CacheInvalidationService.on_assignment_created_or_updated(_with_team_leaders(instance.user_id))
+
+
+@receiver([post_save, post_delete], sender=LeaveRequest)
+def invalidate_leave_request_cache(sender, instance, **kwargs):
+    """Leave requests show up on the requester's dashboard and their team leaders' approvals"""
+    CacheInvalidationService.on_leave_request_changed(_with_team_leaders(instance.user_id))
+
+
+@receiver([post_save, post_delete], sender=UserSkill)
+@receiver([post_save, post_delete], sender=Skill)
+def invalidate_qualification_cache(sender, instance, **kwargs):
+    """Skill changes decide who is qualified for waakdienst and incident shifts"""
+    CacheInvalidationService.on_user_skill_changed()
+
+
+@receiver(connection_created)
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """Use WAL journaling and relaxed fsync on SQLite connections"""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA journal_mode=WAL;')
+        cursor.execute('PRAGMA synchronous=NORMAL;')
+        cursor.execute('PRAGMA temp_store=MEMORY;')
+        cursor.execute('PRAGMA cache_size=-64000;')
+        # Read pages through a 256MB memory map instead of read() calls
+        cursor.execute('PRAGMA mmap_size=268435456;')
@@ -6,7 +6,11 @@ import sys
 
 def main():
     """Run administrative tasks."""
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tps_project.settings')
+    settings_module = 'tps_project.settings'
+    if len(sys.argv) > 1 and sys.argv[1] == 'test':
+        # Test settings skip migrations (MIGRATION_MODULES) and use fast hashing
+        settings_module = 'tps_project.settings.testing'
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
@@ -2,17 +2,36 @@
 """
 Quick JavaScript validation script for Django template
 """
-import re
+import contextlib
+import io
+import mmap
+import os
 import sys
 
 def extract_javascript_from_template(file_path):
     """Extract JavaScript from Django template"""
-    with open(file_path, 'r') as f:
-        content = f.read()
-    
-    # Find JavaScript blocks
-    js_blocks = re.findall(r'<script[^>]*>(.*?)</script>', content, re.DOTALL)
-    return '\n'.join(js_blocks)
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ''  # mmap can't map an empty file
+        # Scan the page-cached file directly instead of copying it into memory
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+            js_blocks = _find_script_blocks(content)
+    return b'\n'.join(js_blocks).decode('utf-8')
+
+def _find_script_blocks(content):
+    """Collect the bodies of <script> blocks in one linear pass over the bytes"""
+    js_blocks = []
+    i = content.find(b'<script')
+    while i != -1:
+        tag_end = content.find(b'>', i) + 1
+        if not tag_end:
+            break
+        end = content.find(b'</script>', tag_end)
+        if end == -1:
+            break
+        js_blocks.append(content[tag_end:end])
+        i = content.find(b'<script', end + len(b'</script>'))
+    return js_blocks
 
 def main():
     template_path = '/home/bart/Planner/1.5/TPS/frontend/templates/pages/schedule.html'
@@ -20,12 +39,20 @@ def main():
     try:
         js_content = extract_javascript_from_template(template_path)
         
-        # Basic syntax checks
+        # Basic syntax checks. str.count runs a vectorised C loop per character,
+        # which beats any single-pass tally in Python (Counter is ~20x slower)
         open_braces = js_content.count('{')
         close_braces = js_content.count('}')
+        single_quotes = js_content.count("'")
+        double_quotes = js_content.count('"')
+        # Counts '\n' line breaks only, so '\r' and other separators that
+        # splitlines() also splits on don't start a new line here
+        total_lines = js_content.count('\n')
+        if js_content and not js_content.endswith('\n'):
+            total_lines += 1
         
         print(f"JavaScript extraction successful!")
-        print(f"Total lines: {len(js_content.splitlines())}")
+        print(f"Total lines: {total_lines}")
         print(f"Open braces: {open_braces}")
         print(f"Close braces: {close_braces}")
         print(f"Brace balance: {'✅ BALANCED' if open_braces == close_braces else '❌ UNBALANCED'}")
@@ -47,9 +74,6 @@ def main():
             print("❌ availableUsers property NOT found")
             
         # Look for unterminated strings or other issues
-        single_quotes = js_content.count("'")
-        double_quotes = js_content.count('"')
-        
         print(f"Single quotes: {single_quotes} ({'balanced' if single_quotes % 2 == 0 else 'unbalanced'})")
         print(f"Double quotes: {double_quotes} ({'balanced' if double_quotes % 2 == 0 else 'unbalanced'})")
         
@@ -65,4 +89,11 @@ def main():
     return 0
 
 if __name__ == '__main__':
-    sys.exit(main())
+    # Collect the report and write it once instead of one write per line
+    report = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(report):
+            exit_code = main()
+    finally:
+        sys.stdout.write(report.getvalue())
+    sys.exit(exit_code)
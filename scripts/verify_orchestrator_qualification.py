@@ -2,22 +2,19 @@
 """
 Verification script to check if users are properly qualified for orchestrator
 """
+import argparse
+import atexit
+import contextlib
+import io
 import os
 import sys
-import django
 
-# Setup Django environment
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tps_project.settings')
-django.setup()
-
-from django.contrib.auth import get_user_model
-from apps.accounts.models import UserSkill
-from apps.teams.models import Team
-from core.services.planning_orchestrator import PlanningOrchestrator
+def verify_orchestrator_qualification():
+    from django.contrib.auth import get_user_model
+    from apps.accounts.models import UserSkill
 
-User = get_user_model()
+    User = get_user_model()
 
-def verify_orchestrator_qualification():
     print("Verifying Orchestrator User Qualification")
     print("=" * 50)
     
@@ -26,8 +23,16 @@ def verify_orchestrator_qualification():
         user = User.objects.get(username='user10')
         print(f"✅ Found user: {user.username} ({user.first_name} {user.last_name})")
         
+        # Only pay for the planning services once there is a user to check
+        from apps.teams.models import Team
+        from core.services.planning_orchestrator import PlanningOrchestrator
+        
         # Check skills
-        user_skills = UserSkill.objects.filter(user=user)
+        user_skills = (
+            UserSkill.objects.filter(user=user)
+            .select_related('skill')
+            .only('proficiency_level', 'skill__name')
+        )
         print(f"User skills:")
         for skill in user_skills:
             print(f"  - {skill.skill.name}: {skill.proficiency_level}")
@@ -40,8 +45,8 @@ def verify_orchestrator_qualification():
         orchestrator = PlanningOrchestrator(team)
         
         # Check if user is in qualified lists
-        waakdienst_qualified = user in orchestrator.waakdienst_service.qualified_engineers
-        incident_qualified = user in orchestrator.incident_service.qualified_engineers
+        waakdienst_qualified = user.pk in orchestrator.waakdienst_service.qualified_engineer_ids
+        incident_qualified = user.pk in orchestrator.incident_service.qualified_engineer_ids
         
         print(f"✅ Qualified for Waakdienst: {waakdienst_qualified}")
         print(f"✅ Qualified for Incident: {incident_qualified}")
@@ -69,5 +74,30 @@ def verify_orchestrator_qualification():
     except Exception as e:
         print(f"❌ Error: {e}")
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.parse_args(argv)
+
+    # Set up Django only once the arguments are fine, so --help stays instant
+    import django
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tps_project.settings')
+    django.setup()
+
+    from django.db import connections, transaction
+
+    # Close the database connection cleanly when the script exits
+    atexit.register(connections.close_all)
+
+    # Collect the report and write it once instead of one write per line
+    report = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(report):
+            # One transaction for all the lookups: a single BEGIN/COMMIT and a
+            # consistent snapshot, instead of autocommit around every query
+            with transaction.atomic():
+                verify_orchestrator_qualification()
+    finally:
+        sys.stdout.write(report.getvalue())
+
 if __name__ == "__main__":
-    verify_orchestrator_qualification()
+    main()
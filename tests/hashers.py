@@ -0,0 +1,28 @@
+"""
+Password hasher for the test settings only
+
+Stores passwords unhashed so creating users in fixtures costs no hashing or
+salt generation. Never reference this outside tps_project.settings.testing.
+"""
+from django.contrib.auth.hashers import BasePasswordHasher, mask_hash
+from django.utils.crypto import constant_time_compare
+
+
+class PlainPasswordHasher(BasePasswordHasher):
+    algorithm = 'plain'
+
+    def salt(self):
+        return ''
+
+    def encode(self, password, salt):
+        return f'{self.algorithm}$${password}'
+
+    def decode(self, encoded):
+        algorithm, salt, password = encoded.split('$', 2)
+        return {'algorithm': algorithm, 'hash': password, 'salt': salt}
+
+    def verify(self, password, encoded):
+        return constant_time_compare(encoded, self.encode(password, ''))
+
+    def safe_summary(self, encoded):
+        return {'algorithm': self.algorithm, 'hash': mask_hash(self.decode(encoded)['hash'])}
@@ -0,0 +1,28 @@
+"""
+TPS V1.4 - Shared Test Fixtures
+Class-level fixture mixins reused across test modules
+"""
+
+from apps.accounts.models import Skill, SkillCategory
+
+
+class SkillFixtureMixin:
+    """
+    Create one skill category and skill per test class
+
+    Mix in ahead of TestCase; get_or_create keeps the fixture idempotent when
+    several classes share a database. Override the names to pick the skill.
+    """
+    skill_category_name = 'Technical'
+    skill_name = 'Python'
+    
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.skill_category, _ = SkillCategory.objects.get_or_create(
+            name=cls.skill_category_name
+        )
+        cls.skill, _ = Skill.objects.get_or_create(
+            name=cls.skill_name,
+            defaults={'category': cls.skill_category}
+        )
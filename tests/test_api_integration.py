@@ -16,18 +16,22 @@ User = get_user_model()
 
 
 class APIIntegrationTest(TestCase):
-    """Test API endpoints work correctly"""
+    """Test API endpoints and overall system health against shared fixtures"""
     
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # One API client for the whole class; authentication is reset per test
+        cls.api_client = APIClient()
+    
+    @classmethod
+    def setUpTestData(cls):
         """Create minimal test data for API tests"""
-        self.client = APIClient()
-        
         # Get test configuration
         test_config = config_manager.get_test_config()
-        org_config = config_manager.get_organization_config()
         
         # Create admin user for API authentication
-        self.admin_user = User.objects.create_user(
+        cls.admin_user = User.objects.create_user(
             username="admin",
             email=config_manager.generate_test_email("admin"),
             password=test_config['test_password'],
@@ -37,7 +41,7 @@ class APIIntegrationTest(TestCase):
         )
         
         # Create regular user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username="testuser",
             email=config_manager.generate_test_email("testuser"), 
             password=test_config['test_password'],
@@ -45,12 +49,16 @@ class APIIntegrationTest(TestCase):
         )
         
         # Create team
-        self.team = Team.objects.create(
+        cls.team = Team.objects.create(
             name="Test Team",
             description="Integration test team",
             department="Engineering"
         )
     
+    def setUp(self):
+        self.client = self.api_client
+        self.client.force_authenticate(user=None)
+    
     def test_api_authentication(self):
         """Test API authentication works"""
         # Test unauthenticated request
@@ -98,35 +106,20 @@ class APIIntegrationTest(TestCase):
         response = self.client.get('/api/v1/assignments/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIsInstance(response.data, list)
-
-
-class SystemHealthTest(TestCase):
-    """Test overall system health"""
     
     def test_database_connection(self):
         """Test database operations work"""
-        # Create a user
-        user = User.objects.create_user(
-            username="healthtest",
-            email=config_manager.generate_test_email("healthtest"),
-            employee_id=config_manager.generate_employee_id(999, "HEALTH")
-        )
-        
-        # Verify user was created
-        self.assertIsNotNone(user.id)
-        self.assertEqual(user.username, "healthtest")
+        # Verify the class-level user was created
+        self.assertIsNotNone(self.user.id)
+        self.assertEqual(self.user.username, "testuser")
         
         # Query users
-        users = User.objects.filter(username="healthtest")
+        users = User.objects.filter(username="testuser")
         self.assertEqual(users.count(), 1)
     
     def test_user_model_fields(self):
         """Test user model has expected fields"""
-        user = User.objects.create_user(
-            username="fieldtest",
-            email=config_manager.generate_test_email("fieldtest"),
-            employee_id=config_manager.generate_employee_id(999, "FIELD")
-        )
+        user = self.user
         
         # Test required fields exist
         self.assertTrue(hasattr(user, 'username'))
@@ -141,16 +134,11 @@ class SystemHealthTest(TestCase):
     
     def test_team_model_basic_operations(self):
         """Test team model basic operations"""
-        # Create team
-        team = Team.objects.create(
-            name="Health Test Team",
-            description="Health test",
-            department="IT"
-        )
+        team = self.team
         
         # Verify team was created
         self.assertIsNotNone(team.id)
-        self.assertEqual(team.name, "Health Test Team")
+        self.assertEqual(team.name, "Test Team")
         self.assertTrue(team.is_active)
         
         # Test team methods
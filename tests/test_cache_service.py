@@ -0,0 +1,122 @@
+"""
+Tests for CacheService dashboard caching and its signal-driven invalidation
+"""
+from datetime import date
+
+import pytest
+from django.core.cache import cache
+
+from apps.leave_management.models import LeaveRequest, LeaveType
+from apps.teams.models import TeamMembership
+from core.services.cache_service import CacheService
+from core.services.dashboard_service import DashboardService
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    """Real cache backend (the test settings use DummyCache)"""
+    settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+@pytest.mark.unit
+class TestDashboardCache:
+    """Test dashboard data is dropped per user, never by clearing the cache"""
+
+    def test_invalidate_one_dashboard(self, locmem_cache):
+        """Test a typed invalidation only drops that dashboard"""
+        CacheService.set_dashboard_data(1, 'user', {'n': 1})
+        CacheService.set_dashboard_data(1, 'context_USER', {'n': 2})
+
+        CacheService.invalidate_dashboard_data(1, 'user')
+
+        assert CacheService.get_dashboard_data(1, 'user') is None
+        assert CacheService.get_dashboard_data(1, 'context_USER') == {'n': 2}
+
+    def test_invalidate_all_user_dashboards(self, locmem_cache):
+        """Test an untyped invalidation drops every dashboard of that user only"""
+        CacheService.set_dashboard_data(1, 'user', {'n': 1})
+        CacheService.set_dashboard_data(1, 'context_USER', {'n': 2})
+        CacheService.set_dashboard_data(2, 'user', {'n': 3})
+        locmem_cache.set('unrelated', 'kept')
+
+        CacheService.invalidate_dashboard_data(1)
+
+        assert CacheService.get_dashboard_data(1, 'user') is None
+        assert CacheService.get_dashboard_data(1, 'context_USER') is None
+        assert CacheService.get_dashboard_data(2, 'user') == {'n': 3}
+        assert locmem_cache.get('unrelated') == 'kept'
+
+        CacheService.set_dashboard_data(1, 'user', {'n': 4})
+        assert CacheService.get_dashboard_data(1, 'user') == {'n': 4}
+
+
+@pytest.mark.integration
+class TestDashboardCacheSignals:
+    """Test model changes invalidate the dashboards of the affected users"""
+
+    def test_team_change_only_drops_member_dashboards(self, locmem_cache, team_role, team_factory, user_factory):
+        """Test a team change drops its members' dashboards and nothing else"""
+        team = team_factory()
+        member, outsider = user_factory(), user_factory()
+        TeamMembership.objects.create(team=team, user=member, role=team_role)
+        CacheService.set_dashboard_data(member.id, 'user', {'n': 1})
+        CacheService.set_dashboard_data(outsider.id, 'user', {'n': 2})
+        locmem_cache.set('unrelated', 'kept')
+
+        team.description = 'Renamed'
+        team.save()
+        team_factory()
+
+        assert CacheService.get_dashboard_data(member.id, 'user') is None
+        assert CacheService.get_dashboard_data(outsider.id, 'user') == {'n': 2}
+        assert locmem_cache.get('unrelated') == 'kept'
+
+    def test_leave_request_drops_requester_and_leader_dashboards(self, locmem_cache, team_role, team_factory,
+                                                                 user_factory):
+        """Test a leave request drops the requester's and their team leader's dashboards"""
+        leader, requester, outsider = user_factory(), user_factory(), user_factory()
+        team = team_factory(team_leader=leader)
+        TeamMembership.objects.create(team=team, user=requester, role=team_role)
+        leave_type = LeaveType.objects.create(name='Vacation', code='VAC')
+        for user in (leader, requester, outsider):
+            CacheService.set_dashboard_data(user.id, 'user', {'n': user.id})
+
+        LeaveRequest.objects.create(
+            user=requester,
+            leave_type=leave_type,
+            start_date=date(2026, 11, 2),
+            end_date=date(2026, 11, 6),
+            reason='Holiday',
+        )
+
+        assert CacheService.get_dashboard_data(requester.id, 'user') is None
+        assert CacheService.get_dashboard_data(leader.id, 'user') is None
+        assert CacheService.get_dashboard_data(outsider.id, 'user') == {'n': outsider.id}
+
+    def test_approval_queue_is_not_cached(self, locmem_cache, team_role, team_factory, user_factory):
+        """Test a manager's pending approvals reflect changes made without signals"""
+        leader, requester = user_factory(role='MANAGER'), user_factory()
+        team = team_factory(team_leader=leader)
+        TeamMembership.objects.create(team=team, user=requester, role=team_role)
+        leave_type = LeaveType.objects.create(name='Vacation', code='VAC')
+        leave_request = LeaveRequest.objects.create(
+            user=requester,
+            leave_type=leave_type,
+            start_date=date(2026, 11, 2),
+            end_date=date(2026, 11, 6),
+            reason='Holiday',
+            status='submitted',
+        )
+
+        context = DashboardService.get_dashboard_context(leader)
+        assert list(context['pending_leave_approvals']) == [leave_request]
+
+        # A queryset update sends no signals, so the cached context survives
+        LeaveRequest.objects.filter(pk=leave_request.pk).update(status='approved')
+
+        context = DashboardService.get_dashboard_context(leader)
+        assert CacheService.get_dashboard_data(leader.id, 'context_MANAGER') is not None
+        assert list(context['pending_leave_approvals']) == []
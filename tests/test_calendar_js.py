@@ -2,91 +2,72 @@
 """
 Test the calendarData function in Node.js to verify it works
 """
+import json
+import shutil
 import subprocess
-import tempfile
-import sys
+from pathlib import Path
 
-# Extract the calendarData function from the template
-template_path = '/home/bart/Planner/1.5/TPS/frontend/templates/pages/schedule.html'
+import pytest
 
-with open(template_path, 'r') as f:
-    content = f.read()
 
-# Find the JavaScript section
-start_marker = 'function calendarData() {'
-end_marker = '// Ensure function is available globally'
+@pytest.fixture
+def schedule_template(settings):
+    """Read the schedule page template relative to the project BASE_DIR"""
+    path = Path(settings.BASE_DIR) / 'frontend' / 'templates' / 'pages' / 'schedule.html'
+    if not path.exists():
+        pytest.skip(f"Schedule template not found at {path}")
+    return path.read_text()
 
-start_pos = content.find(start_marker)
-end_pos = content.find(end_marker)
 
-if start_pos == -1 or end_pos == -1:
-    print("❌ Could not find JavaScript function boundaries")
-    sys.exit(1)
+@pytest.fixture
+def calendar_data_js(schedule_template):
+    """Extract the calendarData function from the schedule template"""
+    start_marker = 'function calendarData() {'
+    end_marker = '// Ensure function is available globally'
 
-js_function = content[start_pos:end_pos].strip()
+    start_pos = schedule_template.find(start_marker)
+    end_pos = schedule_template.find(end_marker)
 
-# Create a test script
-test_script = f"""
-{js_function}
+    assert start_pos != -1 and end_pos != -1, "Could not find JavaScript function boundaries"
+    return schedule_template[start_pos:end_pos].strip()
 
-// Test the function
-console.log('🧪 Testing calendarData function...');
+
+def test_calendar_data_function(calendar_data_js):
+    """Test that calendarData() executes in Node.js"""
+    if shutil.which('node') is None:
+        pytest.skip("Node.js not found. Install Node.js to run this test.")
+
+    # Create a test script that reports its results as a single JSON line
+    test_script = f"""
+{calendar_data_js}
 
 try {{
     const data = calendarData();
-    console.log('✅ Function executed successfully');
-    console.log('Available users:', data.availableUsers.length);
-    console.log('Available teams:', data.availableTeams.length);
-    console.log('Current view:', data.currentView);
-    console.log('Stats:', JSON.stringify(data.stats));
-    console.log('Assignment types:', data.assignmentTypes.length);
-    console.log('Current period:', data.currentPeriod);
-    
-    // Test some computed properties
-    console.log('\\n📊 Testing computed properties...');
-    console.log('Month days header length:', data.monthDaysHeader.length);
-    console.log('Month users list length:', data.monthUsersList.length);
-    console.log('Month content length:', data.monthContent.length);
-    
-    console.log('\\n🎯 All tests passed!');
-    
+    console.log(JSON.stringify({{
+        availableUsers: data.availableUsers.length,
+        availableTeams: data.availableTeams.length,
+        currentView: data.currentView,
+        stats: data.stats,
+        assignmentTypes: data.assignmentTypes.length,
+        currentPeriod: data.currentPeriod,
+        monthDaysHeader: data.monthDaysHeader.length,
+        monthUsersList: data.monthUsersList.length,
+        monthContent: data.monthContent.length,
+    }}));
 }} catch (error) {{
-    console.error('❌ Error testing function:', error.message);
+    console.error(error.message);
     process.exit(1);
 }}
 """
 
-# Write to temporary file and test with Node.js
-with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-    f.write(test_script)
-    temp_file = f.name
+    # Pipe the script to Node.js on stdin
+    result = subprocess.run(['node'], input=test_script, capture_output=True, text=True, timeout=10)
 
-try:
-    result = subprocess.run(['node', temp_file], capture_output=True, text=True, timeout=10)
-    
-    print("📋 Node.js Test Results:")
-    print("=" * 50)
-    
-    if result.returncode == 0:
-        print("✅ JavaScript executed successfully!")
-        print(result.stdout)
-    else:
-        print("❌ JavaScript execution failed!")
-        print("STDOUT:", result.stdout)
-        print("STDERR:", result.stderr)
-        sys.exit(1)
-        
-except subprocess.TimeoutExpired:
-    print("❌ Test timed out")
-    sys.exit(1)
-except FileNotFoundError:
-    print("❌ Node.js not found. Install Node.js to run this test.")
-    print("For now, assuming JavaScript is correct...")
-finally:
-    import os
-    try:
-        os.unlink(temp_file)
-    except:
-        pass
+    assert result.returncode == 0, f"JavaScript execution failed:\nSTDOUT: {result.stdout}\nSTDERR: {result.stderr}"
 
-print("\n🎉 Calendar data function is working correctly!")
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    assert isinstance(data['stats'], dict)
+    assert isinstance(data['currentView'], str)
+    for key in ('availableUsers', 'availableTeams', 'assignmentTypes',
+                'monthDaysHeader', 'monthUsersList', 'monthContent'):
+        assert data[key] >= 0, f"{key} should be a list length"
@@ -15,16 +15,34 @@ from apps.teams.models import Team, TeamMembership
 from apps.scheduling.models import ShiftTemplate, ShiftInstance, ShiftCategory
 
 
+# Waakdienst coverage per shift (hours), Wednesday 17:00 through Wednesday 08:00
+WAAKDIENST_COVERAGE = (
+    7,   # Wed 17:00-24:00
+    8,   # Thu 00:00-08:00
+    7,   # Thu 17:00-24:00
+    8,   # Fri 00:00-08:00
+    7,   # Fri 17:00-24:00
+    24,  # Sat 00:00-24:00
+    24,  # Sun 00:00-24:00
+    8,   # Mon 00:00-08:00
+    7,   # Mon 17:00-24:00
+    8,   # Tue 00:00-08:00
+    7,   # Tue 17:00-24:00
+    8,   # Wed 00:00-08:00
+)
+WAAKDIENST_TOTAL_HOURS = sum(WAAKDIENST_COVERAGE)
+
+
 @pytest.mark.unit
 @pytest.mark.critical
 class TestPlanningOrchestrator:
     """Test Planning Orchestrator core functionality"""
     
-    def test_orchestrator_initialization(self, team_with_members):
+    def test_orchestrator_initialization(self, mock_team, db):
         """Test orchestrator initializes with team"""
-        orchestrator = PlanningOrchestrator(team_with_members)
+        orchestrator = PlanningOrchestrator(mock_team)
         
-        assert orchestrator.team == team_with_members
+        assert orchestrator.team == mock_team
         assert hasattr(orchestrator, 'waakdienst_service')
         assert hasattr(orchestrator, 'incident_service')
         assert hasattr(orchestrator, 'fairness_service')
@@ -37,12 +55,12 @@ class TestPlanningOrchestrator:
             PlanningOrchestrator(None)
     
     @patch('core.services.planning_orchestrator.logger')
-    def test_orchestrator_logging(self, mock_logger, team_with_members):
+    def test_orchestrator_logging(self, mock_logger, mock_team, db):
         """Test orchestrator logs initialization"""
-        orchestrator = PlanningOrchestrator(team_with_members)
+        orchestrator = PlanningOrchestrator(mock_team)
         
         mock_logger.info.assert_called_with(
-            f"Initialized Planning Orchestrator for {team_with_members.name}"
+            f"Initialized Planning Orchestrator for {mock_team.name}"
         )
 
 
@@ -51,41 +69,25 @@ class TestPlanningOrchestrator:
 class TestWaakdienstPlanningService:
     """Test Waakdienst Planning Service business logic"""
     
-    def test_service_initialization(self, team_with_members):
+    def test_service_initialization(self, mock_team, db):
         """Test service initializes with team"""
-        service = WaakdienstPlanningService(team_with_members)
-        assert service.team == team_with_members
+        service = WaakdienstPlanningService(mock_team)
+        assert service.team == mock_team
     
-    def test_coverage_pattern_constants(self, team_with_members):
+    def test_coverage_pattern_constants(self, mock_team, db):
         """Test waakdienst coverage pattern is correct"""
-        service = WaakdienstPlanningService(team_with_members)
+        service = WaakdienstPlanningService(mock_team)
         
         # Based on the docstring, waakdienst should cover:
         # 12 separate shifts totaling 123 hours per week
         # This is critical business logic that must be tested
         
-        # Test coverage hours (from docstring):
-        expected_hours = [
-            7,   # Wed 17:00-24:00
-            8,   # Thu 00:00-08:00  
-            7,   # Thu 17:00-24:00
-            8,   # Fri 00:00-08:00
-            7,   # Fri 17:00-24:00
-            24,  # Sat 00:00-24:00
-            24,  # Sun 00:00-24:00
-            8,   # Mon 00:00-08:00
-            7,   # Mon 17:00-24:00
-            8,   # Tue 00:00-08:00
-            7,   # Tue 17:00-24:00
-            8    # Wed 00:00-08:00
-        ]
-        
-        total_expected_hours = sum(expected_hours)
-        assert total_expected_hours == 123, "Waakdienst coverage should be 123 hours per week"
+        assert len(WAAKDIENST_COVERAGE) == 12
+        assert WAAKDIENST_TOTAL_HOURS == 123, "Waakdienst coverage should be 123 hours per week"
     
-    def test_handover_period_exclusion(self, team_with_members):
+    def test_handover_period_exclusion(self, mock_team, db):
         """Test handover period (Wed 08:00-17:00) is excluded"""
-        service = WaakdienstPlanningService(team_with_members)
+        service = WaakdienstPlanningService(mock_team)
         
         # Handover period: Wednesday 08:00-17:00 (9 hours)
         # This should be covered by incident planning, not waakdienst
@@ -97,7 +99,36 @@ class TestWaakdienstPlanningService:
         business_hours = 36
         expected_waakdienst_hours = 168 - handover_hours - business_hours
         
-        assert expected_waakdienst_hours == 123, "Waakdienst should cover 123 hours (excluding handover and business hours)"
+        assert expected_waakdienst_hours == WAAKDIENST_TOTAL_HOURS, "Waakdienst should cover 123 hours (excluding handover and business hours)"
+
+    def test_qualified_engineer_ids(self, mock_team, skill_waakdienst, user_factory, django_assert_num_queries):
+        """Test qualified IDs come from the already-loaded engineers"""
+        from apps.accounts.models import UserSkill
+
+        engineer = user_factory()
+        UserSkill.objects.create(user=engineer, skill=skill_waakdienst)
+        user_factory()  # Not qualified
+
+        service = WaakdienstPlanningService(mock_team)
+        with django_assert_num_queries(0):
+            assert service.qualified_engineer_ids == {engineer.pk}
+
+    def test_qualified_engineer_ids_cached(self, mock_team, skill_waakdienst, user_factory, settings,
+                                          django_assert_num_queries):
+        """Test qualified IDs are shared through the cache until skills change"""
+        from apps.accounts.models import UserSkill
+
+        settings.CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+        engineer = user_factory()
+        UserSkill.objects.create(user=engineer, skill=skill_waakdienst)
+        assert WaakdienstPlanningService(mock_team).qualified_engineer_ids == {engineer.pk}
+
+        with django_assert_num_queries(0):
+            assert WaakdienstPlanningService(mock_team).qualified_engineer_ids == {engineer.pk}
+
+        other = user_factory()
+        UserSkill.objects.create(user=other, skill=skill_waakdienst)
+        assert WaakdienstPlanningService(mock_team).qualified_engineer_ids == {engineer.pk, other.pk}
 
 
 @pytest.mark.unit
@@ -105,10 +136,10 @@ class TestWaakdienstPlanningService:
 class TestFairnessService:
     """Test Fairness Service algorithms"""
     
-    def test_fairness_service_initialization(self, team_with_members):
+    def test_fairness_service_initialization(self, mock_team):
         """Test fairness service initializes"""
-        service = FairnessService(team_with_members)
-        assert service.team == team_with_members
+        service = FairnessService(mock_team)
+        assert service.team == mock_team
     
     def test_fairness_calculation_empty_history(self, team_with_members):
         """Test fairness calculation with no assignment history"""
@@ -168,11 +199,11 @@ class TestPlanningServiceIntegration:
         """Test user assignment limits from TPS config"""
         from django.conf import settings
         
-        tps_config = getattr(settings, 'TPS_CONFIG', {})
-        max_waakdienst_weeks = tps_config.get('MAX_WAAKDIENST_WEEKS_PER_YEAR', 8)
-        max_incident_weeks = tps_config.get('MAX_INCIDENT_WEEKS_PER_YEAR', 12)
-        min_gap_waakdienst = tps_config.get('MIN_GAP_WAAKDIENST_DAYS', 14)
-        min_gap_incident = tps_config.get('MIN_GAP_INCIDENT_DAYS', 7)
+        tps_config = settings.TPS_CONFIG
+        max_waakdienst_weeks = tps_config.max_waakdienst_weeks_per_year
+        max_incident_weeks = tps_config.max_incident_weeks_per_year
+        min_gap_waakdienst = tps_config.min_gap_waakdienst_days
+        min_gap_incident = tps_config.min_gap_incident_days
         
         # Test business rules are properly configured
         assert max_waakdienst_weeks == 8, "Max waakdienst weeks should be 8"
@@ -185,6 +216,20 @@ class TestPlanningServiceIntegration:
             user = membership.user
             assert user.ytd_waakdienst_weeks <= max_waakdienst_weeks, f"User {user.username} exceeds waakdienst limit"
             assert user.ytd_incident_weeks <= max_incident_weeks, f"User {user.username} exceeds incident limit"
+    
+    def test_active_members_load_users(self, team_role, team_factory, user_factory, django_assert_num_queries):
+        """Test get_active_members() joins the user instead of one query per member"""
+        team = team_factory()
+        for user in user_factory.create_batch(4):
+            TeamMembership.objects.create(team=team, user=user, role=team_role)
+        
+        members = list(team.get_active_members())
+        assert len(members) == 4
+        
+        with django_assert_num_queries(0):
+            for membership in members:
+                assert membership.user.ytd_waakdienst_weeks >= 0
+                assert membership.user.ytd_incident_weeks >= 0
 
 
 @pytest.mark.integration
@@ -198,23 +243,9 @@ class TestPlanningBusinessRules:
         
         # Mock the planning result to test coverage validation
         # In real implementation, this would generate actual shift instances
-        coverage_periods = [
-            {'start': 'Wed 17:00', 'end': 'Wed 24:00', 'hours': 7},
-            {'start': 'Thu 00:00', 'end': 'Thu 08:00', 'hours': 8},
-            {'start': 'Thu 17:00', 'end': 'Thu 24:00', 'hours': 7},
-            {'start': 'Fri 00:00', 'end': 'Fri 08:00', 'hours': 8},
-            {'start': 'Fri 17:00', 'end': 'Fri 24:00', 'hours': 7},
-            {'start': 'Sat 00:00', 'end': 'Sat 24:00', 'hours': 24},
-            {'start': 'Sun 00:00', 'end': 'Sun 24:00', 'hours': 24},
-            {'start': 'Mon 00:00', 'end': 'Mon 08:00', 'hours': 8},
-            {'start': 'Mon 17:00', 'end': 'Mon 24:00', 'hours': 7},
-            {'start': 'Tue 00:00', 'end': 'Tue 08:00', 'hours': 8},
-            {'start': 'Tue 17:00', 'end': 'Tue 24:00', 'hours': 7},
-            {'start': 'Wed 00:00', 'end': 'Wed 08:00', 'hours': 8},
-        ]
+        coverage_periods = list(WAAKDIENST_COVERAGE)
         
-        total_coverage_hours = sum(period['hours'] for period in coverage_periods)
-        assert total_coverage_hours == 123, "Waakdienst coverage must be exactly 123 hours"
+        assert WAAKDIENST_TOTAL_HOURS == 123, "Waakdienst coverage must be exactly 123 hours"
         
         # Test no gaps in coverage (this would be more complex in real implementation)
         assert len(coverage_periods) == 12, "Waakdienst should have exactly 12 coverage periods"
@@ -251,17 +282,15 @@ class TestPlanningBusinessRules:
 class TestPlanningPerformance:
     """Test planning service performance"""
     
-    def test_large_team_planning_performance(self):
+    def test_large_team_planning_performance(self, team_role, team_factory, user_factory):
         """Test planning performance with larger team"""
         # Create larger team for performance testing
-        from conftest import TeamFactory, UserFactory
-        
-        team = TeamFactory()
-        users = UserFactory.create_batch(20)  # Large team
+        team = team_factory()
+        users = user_factory.create_batch(20)  # Large team
         
         # Add users to team
         for user in users:
-            TeamMembership.objects.create(team=team, user=user)
+            TeamMembership.objects.create(team=team, user=user, role=team_role)
         
         # Test orchestrator can handle large team
         orchestrator = PlanningOrchestrator(team)
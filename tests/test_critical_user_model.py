@@ -211,9 +211,8 @@ class TestUserBusinessLogic:
         
         # Check against TPS business rules (from settings)
         from django.conf import settings
-        tps_config = getattr(settings, 'TPS_CONFIG', {})
-        max_waakdienst = tps_config.get('MAX_WAAKDIENST_WEEKS_PER_YEAR', 8)
-        max_incident = tps_config.get('MAX_INCIDENT_WEEKS_PER_YEAR', 12)
+        max_waakdienst = settings.TPS_CONFIG.max_waakdienst_weeks_per_year
+        max_incident = settings.TPS_CONFIG.max_incident_weeks_per_year
         
         waakdienst_remaining = max_waakdienst - user.ytd_waakdienst_weeks
         incident_remaining = max_incident - user.ytd_incident_weeks
@@ -0,0 +1,71 @@
+"""
+Tests for the fast-path date parsing used by the API serializer and form fields
+"""
+from datetime import date, datetime
+
+from django import forms
+from django.test import SimpleTestCase
+from rest_framework import serializers
+
+from api.serializers.fields import EuropeanDateField, EuropeanDateTimeField
+from core.fast_dateparse import parse_date_fast, parse_datetime_fast, parse_iso_date_fast
+from core.form_fields import EuropeanDateField as EuropeanFormDateField
+
+
+class FastDateParseTest(SimpleTestCase):
+    """The fast parsers agree with strptime and decline anything else"""
+
+    def test_matches_strptime(self):
+        for value in ('01/01/2025', '29/02/2024', '31/12/1999'):
+            with self.subTest(value=value):
+                self.assertEqual(parse_date_fast(value), datetime.strptime(value, '%d/%m/%Y').date())
+        self.assertEqual(parse_datetime_fast('04/03/2025 13:05'), datetime(2025, 3, 4, 13, 5))
+
+    def test_declines_other_shapes(self):
+        for value in ('2025-03-04', '4/3/2025', '+1/03/2025', '31/02/2025', '04/03/2025 25:00', ''):
+            with self.subTest(value=value):
+                self.assertIsNone(parse_datetime_fast(value) if ' ' in value else parse_date_fast(value))
+
+
+class EuropeanDateFieldTest(SimpleTestCase):
+    """Serializer fields use the fast path and fall back to the configured formats"""
+
+    def test_date_field(self):
+        field = EuropeanDateField()
+        self.assertEqual(field.to_internal_value('04/03/2025'), date(2025, 3, 4))
+        self.assertEqual(field.to_internal_value('2025-03-04'), date(2025, 3, 4))
+        with self.assertRaises(serializers.ValidationError):
+            field.to_internal_value('31/02/2025')
+
+    def test_fast_path_respects_input_formats(self):
+        field = EuropeanDateField(input_formats=['%Y-%m-%d'])
+        with self.assertRaises(serializers.ValidationError):
+            field.to_internal_value('04/03/2025')
+
+    def test_datetime_field_is_timezone_aware(self):
+        parsed = EuropeanDateTimeField().to_internal_value('04/03/2025 13:05')
+        self.assertEqual(parsed.replace(tzinfo=None), datetime(2025, 3, 4, 13, 5))
+        self.assertIsNotNone(parsed.tzinfo)
+
+
+class EuropeanDateFormFieldTest(SimpleTestCase):
+    """The form field accepts DD/MM/YYYY and ISO input like forms.DateField"""
+
+    input_formats = ['%d/%m/%Y', '%d.%m.%Y', '%Y-%m-%d']
+
+    def test_parses_preferred_and_iso(self):
+        field = EuropeanFormDateField(input_formats=self.input_formats)
+        self.assertEqual(field.clean(' 04/03/2025 '), date(2025, 3, 4))
+        self.assertEqual(field.clean('2025-03-04'), date(2025, 3, 4))
+        self.assertEqual(field.clean('04.03.2025'), date(2025, 3, 4))
+        self.assertEqual(parse_iso_date_fast('2024-02-29'), date(2024, 2, 29))
+        self.assertIsNone(parse_iso_date_fast('20240229'))
+
+    def test_default_formats_still_apply(self):
+        self.assertEqual(EuropeanFormDateField().clean('2025-03-04'), date(2025, 3, 4))
+
+    def test_rejects_invalid_dates(self):
+        for value in ('31/02/2025', '2025-02-31'):
+            with self.subTest(value=value):
+                with self.assertRaises(forms.ValidationError):
+                    EuropeanFormDateField(input_formats=self.input_formats).clean(value)
@@ -0,0 +1,36 @@
+"""
+Tests for the set-based ALLOWED_HOSTS validation installed by the core app
+"""
+from django.core.exceptions import DisallowedHost
+from django.http import request as http_request
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+
+class FastHostValidationTest(SimpleTestCase):
+    """The patched validate_host accepts and rejects exactly what Django's does"""
+
+    def test_installed(self):
+        self.assertTrue(getattr(http_request.validate_host, 'uses_host_set', False))
+
+    def test_matches_django_semantics(self):
+        allowed_hosts = ('Example.com', '.tps.local', '', '127.0.0.1')
+        cases = {
+            'example.com': True,
+            'tps.local': True,
+            'api.tps.local': True,
+            '127.0.0.1': True,
+            'evil.com': False,
+            'example.com.evil.com': False,
+            '': False,
+        }
+        for host, expected in cases.items():
+            with self.subTest(host=host):
+                self.assertIs(http_request.validate_host(host, allowed_hosts), expected)
+        self.assertTrue(http_request.validate_host('anything.example', ['*']))
+
+    @override_settings(ALLOWED_HOSTS=('tps.example.com',))
+    def test_get_host(self):
+        factory = RequestFactory()
+        self.assertEqual(factory.get('/', HTTP_HOST='tps.example.com:8000').get_host(), 'tps.example.com:8000')
+        with self.assertRaises(DisallowedHost):
+            factory.get('/', HTTP_HOST='other.example.com').get_host()
@@ -0,0 +1,29 @@
+"""
+Tests for the queued file logging handler
+"""
+import logging
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from core.log_handlers import QueuedFileHandler
+
+
+class QueuedFileHandlerTest(SimpleTestCase):
+    """Records are formatted by the handler and written once it is closed"""
+
+    def test_writes_formatted_records_on_close(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'tps.log'
+            handler = QueuedFileHandler(path)
+            handler.setFormatter(logging.Formatter('%(levelname)s %(message)s'))
+            logger = logging.getLogger('tps.tests.queued_file')
+            logger.addHandler(handler)
+            logger.propagate = False
+            try:
+                logger.warning('disk %s', 'full')
+            finally:
+                logger.removeHandler(handler)
+                handler.close()
+            self.assertEqual(path.read_text(), 'WARNING disk full\n')
@@ -0,0 +1,45 @@
+"""
+Tests for the probe fast path in core.middleware
+"""
+import json
+
+from django.core.exceptions import DisallowedHost
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import reverse
+
+from core.middleware import FastPathMiddleware
+
+
+class FastPathMiddlewareTest(SimpleTestCase):
+    """Probe paths are answered directly; everything else goes down the chain"""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.middleware = FastPathMiddleware(lambda request: 'next')
+
+    def test_fast_paths_match_urlconf(self):
+        for name in ('health_check', 'readiness_check', 'liveness_check', 'metrics'):
+            with self.subTest(name=name):
+                self.assertIn(reverse(name), FastPathMiddleware.FAST_PATHS)
+
+    def test_liveness_short_circuits(self):
+        response = self.middleware(self.factory.get('/health/live/'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['status'], 'alive')
+        self.assertIn('no-cache', response['Cache-Control'])
+
+    @override_settings(ALLOWED_HOSTS=['tps.example.com'])
+    def test_host_is_validated(self):
+        request = self.factory.get('/health/live/', HTTP_HOST='evil.example.com')
+        with self.assertRaises(DisallowedHost):
+            self.middleware(request)
+        response = self.client.get('/health/live/', HTTP_HOST='evil.example.com')
+        self.assertEqual(response.status_code, 400)
+
+    def test_other_requests_pass_through(self):
+        self.assertEqual(self.middleware(self.factory.get('/health/other/')), 'next')
+        self.assertEqual(self.middleware(self.factory.post('/health/live/')), 'next')
+
+    def test_probe_views_only_accept_safe_methods(self):
+        response = self.client.post('/health/live/')
+        self.assertEqual(response.status_code, 405)
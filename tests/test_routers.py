@@ -0,0 +1,36 @@
+"""
+Tests for the read-replica database router
+"""
+from django.db import transaction
+from django.test import SimpleTestCase
+
+from apps.assignments.models import Assignment
+from apps.scheduling.models import ShiftInstance
+from apps.teams.models import Team
+from core.routers import ReplicaRouter
+
+
+class ReplicaRouterTest(SimpleTestCase):
+    """Scheduling reads go to the replica; writes and migrations stay on the primary"""
+
+    databases = {'default'}
+    router = ReplicaRouter()
+
+    def test_reads(self):
+        self.assertEqual(self.router.db_for_read(ShiftInstance), 'replica')
+        self.assertEqual(self.router.db_for_read(Assignment), 'replica')
+        self.assertIsNone(self.router.db_for_read(Team))
+
+    def test_reads_in_transaction(self):
+        with transaction.atomic():
+            self.assertIsNone(self.router.db_for_read(ShiftInstance))
+            self.assertIsNone(self.router.db_for_read(Assignment))
+        self.assertEqual(self.router.db_for_read(Assignment), 'replica')
+
+    def test_writes(self):
+        for model in (ShiftInstance, Assignment, Team):
+            self.assertEqual(self.router.db_for_write(model), 'default')
+
+    def test_migrations(self):
+        self.assertFalse(self.router.allow_migrate('replica', 'scheduling'))
+        self.assertIsNone(self.router.allow_migrate('default', 'scheduling'))
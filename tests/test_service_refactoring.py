@@ -4,152 +4,124 @@ Tests the new dashboard service and user service implementations
 """
 
 import pytest
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from datetime import timedelta
 
 from core.services import DashboardService, UserService, PermissionService
+from tests.mixins import SkillFixtureMixin
 from apps.teams.models import Team, TeamMembership
-from apps.accounts.models import User, Skill, SkillCategory, UserSkill
+from apps.accounts.models import User, UserSkill
 from apps.assignments.models import Assignment
 from apps.scheduling.models import ShiftTemplate, ShiftInstance, ShiftCategory
 
 User = get_user_model()
 
+# Keys every dashboard context carries from ContextService.get_base_context
+BASE_CONTEXT_KEYS = frozenset({'today', 'current_time'})
+
 
 class TestDashboardService(TestCase):
     """Test the new dashboard service with strategy pattern"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
         # Create required TeamRole first
         from apps.teams.models import TeamRole
-        self.team_role = TeamRole.objects.create(
+        cls.team_role = TeamRole.objects.create(
             name='member',
             description='Team Member'
         )
         
-        # Create users with different roles
-        self.admin_user = User.objects.create_user(
-            username='admin_test',
-            email='admin@test.com',
-            role='ADMIN',
-            employee_id='A001'
-        )
-        
-        self.manager_user = User.objects.create_user(
-            username='manager_test', 
-            email='manager@test.com',
-            role='MANAGER',
-            employee_id='M001'
-        )
-        
-        self.planner_user = User.objects.create_user(
-            username='planner_test',
-            email='planner@test.com', 
-            role='PLANNER',
-            employee_id='P001'
-        )
-        
-        self.regular_user = User.objects.create_user(
-            username='user_test',
-            email='user@test.com',
-            role='USER', 
-            employee_id='U001'
-        )
+        # Create users with different roles in one INSERT
+        users = [
+            User(username='admin_test', email='admin@test.com', role='ADMIN', employee_id='A001'),
+            User(username='manager_test', email='manager@test.com', role='MANAGER', employee_id='M001'),
+            User(username='planner_test', email='planner@test.com', role='PLANNER', employee_id='P001'),
+            User(username='user_test', email='user@test.com', role='USER', employee_id='U001'),
+        ]
+        for user in users:
+            user.set_unusable_password()
+        (cls.admin_user, cls.manager_user,
+         cls.planner_user, cls.regular_user) = User.objects.bulk_create(users)
         
         # Create a test team
-        self.test_team = Team.objects.create(
+        cls.test_team = Team.objects.create(
             name='Test Team',
             department='IT',
-            team_leader=self.manager_user
+            team_leader=cls.manager_user
         )
         
         # Add team memberships
         TeamMembership.objects.create(
-            user=self.regular_user,
-            team=self.test_team,
-            role=self.team_role,
+            user=cls.regular_user,
+            team=cls.test_team,
+            role=cls.team_role,
             is_active=True
         )
     
-    def test_admin_dashboard_context(self):
-        """Test admin dashboard context generation"""
-        context = DashboardService.get_dashboard_context(self.admin_user)
-        
-        self.assertEqual(context['dashboard_type'], 'admin')
-        self.assertIn('total_users', context)
-        self.assertIn('total_teams', context)
-        self.assertIn('system_health', context)
-        self.assertIn('recent_activity', context)
-        
-        # Test that context includes base data
-        self.assertIn('today', context)
-        self.assertIn('current_time', context)
-    
-    def test_manager_dashboard_context(self):
-        """Test manager dashboard context generation"""
-        context = DashboardService.get_dashboard_context(self.manager_user)
-        
-        self.assertEqual(context['dashboard_type'], 'manager')
-        self.assertIn('managed_teams', context)
-        self.assertIn('total_managed_teams', context)
-        self.assertIn('pending_approvals', context)
-        self.assertIn('team_stats', context)
-        
-        # Verify manager sees their managed teams
-        managed_teams = context['managed_teams']
-        self.assertEqual(managed_teams.first().id, self.test_team.id)
-    
-    def test_planner_dashboard_context(self):
-        """Test planner dashboard context generation"""
-        context = DashboardService.get_dashboard_context(self.planner_user)
+    def test_dashboard_contexts(self):
+        """Test dashboard context generation and strategy selection for each role"""
+        cases = [
+            (self.admin_user, 'admin', 'AdminDashboardStrategy',
+             {'total_users', 'total_teams', 'system_health', 'recent_activity'}),
+            (self.manager_user, 'manager', 'ManagerDashboardStrategy',
+             {'managed_teams', 'total_managed_teams', 'pending_approvals', 'team_stats'}),
+            (self.planner_user, 'planner', 'PlannerDashboardStrategy',
+             {'planning_periods', 'unassigned_shifts', 'planning_advice', 'recent_planning_activity'}),
+            (self.regular_user, 'user', 'UserDashboardStrategy',
+             {'upcoming_shifts', 'my_leave_requests', 'incident_engineer_today',
+              'waakdienst_engineer_today', 'total_working_today', 'personal_advice'}),
+        ]
+        
+        for user, dashboard_type, strategy_name, expected_keys in cases:
+            with self.subTest(role=dashboard_type):
+                strategy = DashboardService.get_strategy_for_user(user)
+                self.assertEqual(strategy.__class__.__name__, strategy_name)
+                
+                context = DashboardService.get_dashboard_context(user)
+                self.assertEqual(context['dashboard_type'], dashboard_type)
+                
+                # Role keys plus the base data; the difference lists any missing keys
+                self.assertEqual((expected_keys | BASE_CONTEXT_KEYS) - context.keys(), set())
+                
+                if dashboard_type == 'manager':
+                    # Verify manager sees their managed teams
+                    managed_teams = context['managed_teams']
+                    self.assertEqual(managed_teams.first().id, self.test_team.id)
+
+    def test_manager_team_stats_single_query(self):
+        """Manager team stats load teams, member counts and assignment counts together"""
+        strategy = DashboardService.get_strategy_for_user(self.manager_user)
         
-        self.assertEqual(context['dashboard_type'], 'planner')
-        self.assertIn('planning_periods', context)
-        self.assertIn('unassigned_shifts', context)
-        self.assertIn('planning_advice', context)
-        self.assertIn('recent_planning_activity', context)
-    
-    def test_user_dashboard_context(self):
-        """Test regular user dashboard context generation"""
-        context = DashboardService.get_dashboard_context(self.regular_user)
+        with self.assertNumQueries(1):
+            team_stats = strategy._get_team_stats(strategy._get_managed_teams())
         
-        self.assertEqual(context['dashboard_type'], 'user')
-        self.assertIn('upcoming_shifts', context)
-        self.assertIn('my_leave_requests', context)
-        self.assertIn('incident_engineer_today', context)
-        self.assertIn('waakdienst_engineer_today', context)
-        self.assertIn('total_working_today', context)
-        self.assertIn('personal_advice', context)
-    
-    def test_strategy_selection(self):
-        """Test that correct strategy is selected for each role"""
-        admin_strategy = DashboardService.get_strategy_for_user(self.admin_user)
-        manager_strategy = DashboardService.get_strategy_for_user(self.manager_user)
-        planner_strategy = DashboardService.get_strategy_for_user(self.planner_user)
-        user_strategy = DashboardService.get_strategy_for_user(self.regular_user)
-        
-        self.assertEqual(admin_strategy.__class__.__name__, 'AdminDashboardStrategy')
-        self.assertEqual(manager_strategy.__class__.__name__, 'ManagerDashboardStrategy')
-        self.assertEqual(planner_strategy.__class__.__name__, 'PlannerDashboardStrategy')
-        self.assertEqual(user_strategy.__class__.__name__, 'UserDashboardStrategy')
+        self.assertEqual(len(team_stats), 1)
+        self.assertEqual(team_stats[0]['team'], self.test_team)
+        self.assertEqual(team_stats[0]['members'], 1)
+        self.assertEqual(team_stats[0]['this_week_assignments'], 0)
 
 
-class TestUserService(TestCase):
+class TestUserService(SkillFixtureMixin, TestCase):
     """Test the new user service"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
+        super().setUpTestData()
+        
         # Create required TeamRole first
         from apps.teams.models import TeamRole
-        self.team_role = TeamRole.objects.create(
+        cls.team_role = TeamRole.objects.create(
             name='member',
             description='Team Member'
         )
         
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='test_user',
             email='test@example.com',
             first_name='Test',
@@ -158,55 +130,50 @@ class TestUserService(TestCase):
             role='USER'
         )
         
-        # Create skill data
-        self.skill_category = SkillCategory.objects.create(
-            name='Technical',
-            description='Technical skills'
-        )
-        
-        self.skill = Skill.objects.create(
-            name='Python',
-            category=self.skill_category,
-            description='Python programming'
-        )
-        
-        self.user_skill = UserSkill.objects.create(
-            user=self.user,
-            skill=self.skill,
+        cls.user_skill = UserSkill.objects.create(
+            user=cls.user,
+            skill=cls.skill,
             proficiency_level='intermediate'
         )
         
         # Create team data
-        self.team = Team.objects.create(
+        cls.team = Team.objects.create(
             name='Development Team',
             department='IT'
         )
         
         TeamMembership.objects.create(
-            user=self.user,
-            team=self.team,
-            role=self.team_role,
+            user=cls.user,
+            team=cls.team,
+            role=cls.team_role,
             is_active=True
         )
     
     def test_user_profile_data(self):
         """Test user profile data retrieval"""
         user_service = UserService(self.user)
-        profile_data = user_service.get_user_profile_data()
+        
+        # Team leader check + one query each for skills, teams and assignments;
+        # related objects must come from joins, not per-row queries
+        with self.assertNumQueries(4):
+            profile_data = user_service.get_user_profile_data()
+            skills = list(profile_data['skills'])
+            teams = list(profile_data['teams'])
+            list(profile_data['recent_assignments'])
+            for user_skill in skills:
+                user_skill.skill.category
+            for team in teams:
+                team.team_leader
         
         self.assertEqual(profile_data['user'], self.user)
-        self.assertIn('ytd_stats', profile_data)
-        self.assertIn('skills', profile_data)
-        self.assertIn('teams', profile_data)
-        self.assertIn('role_permissions', profile_data)
+        required = {'ytd_stats', 'skills', 'teams', 'role_permissions'}
+        self.assertEqual(required - profile_data.keys(), set())
         self.assertIn('recent_assignments', profile_data)
         
         # Test skills are included
-        skills = profile_data['skills']
-        self.assertEqual(skills.first().skill, self.skill)
+        self.assertEqual(skills[0].skill, self.skill)
         
         # Test teams are included 
-        teams = profile_data['teams']
         self.assertIn(self.team, teams)
     
     def test_role_permissions(self):
@@ -214,15 +181,17 @@ class TestUserService(TestCase):
         user_service = UserService(self.user)
         permissions = user_service.get_role_permissions(self.user)
         
-        self.assertIn('can_access_planning', permissions)
-        self.assertIn('can_access_analytics', permissions)
-        self.assertIn('can_manage_teams', permissions)
-        self.assertIn('is_team_leader', permissions)
+        required = {'can_access_planning', 'can_access_analytics', 'can_manage_teams', 'is_team_leader'}
+        self.assertEqual(required - permissions.keys(), set())
         
         # Regular user should not have advanced permissions
         self.assertFalse(permissions['can_access_planning'])
         self.assertFalse(permissions['can_access_analytics'])
         self.assertFalse(permissions['can_manage_teams'])
+        
+        # Repeat lookups for the same user object are served from the instance
+        with self.assertNumQueries(0):
+            self.assertEqual(user_service.get_role_permissions(self.user), permissions)
     
     def test_workload_stats(self):
         """Test workload statistics calculation"""
@@ -241,34 +210,17 @@ class TestUserService(TestCase):
         self.assertEqual(stats['total_hours'], 0.0)
 
 
-class TestPermissionService(TestCase):
+class TestPermissionService(SimpleTestCase):
     """Test the permission service"""
     
-    def setUp(self):
-        """Set up test users"""
-        self.admin_user = User.objects.create_user(
-            username='admin',
-            role='ADMIN',
-            employee_id='A001'
-        )
-        
-        self.manager_user = User.objects.create_user(
-            username='manager',
-            role='MANAGER', 
-            employee_id='M001'
-        )
-        
-        self.planner_user = User.objects.create_user(
-            username='planner',
-            role='PLANNER',
-            employee_id='P001'
-        )
-        
-        self.user = User.objects.create_user(
-            username='user',
-            role='USER',
-            employee_id='U001'
-        )
+    @classmethod
+    def setUpClass(cls):
+        """Set up unsaved test users (role checks need no database)"""
+        super().setUpClass()
+        cls.admin_user = User(username='admin', role='ADMIN', employee_id='A001')
+        cls.manager_user = User(username='manager', role='MANAGER', employee_id='M001')
+        cls.planner_user = User(username='planner', role='PLANNER', employee_id='P001')
+        cls.user = User(username='user', role='USER', employee_id='U001')
     
     def test_permission_checks(self):
         """Test various permission checks"""
@@ -309,8 +261,7 @@ class TestServiceIntegration(TestCase):
         dashboard_context = DashboardService.get_dashboard_context(self.user)
         
         # Verify context has expected structure
-        self.assertIn('dashboard_type', dashboard_context)
-        self.assertIn('current_user', dashboard_context)
+        self.assertEqual({'dashboard_type', 'current_user'} - dashboard_context.keys(), set())
         
         # Test that user service can work with the same user
         user_service = UserService(self.user)
@@ -336,4 +287,17 @@ class TestServiceIntegration(TestCase):
         role_permissions = profile_data['role_permissions']
         
         self.assertTrue(role_permissions['can_access_planning'])
-        self.assertTrue(role_permissions['is_manager'])
\ No newline at end of file
+        self.assertTrue(role_permissions['is_manager'])
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_dashboard_context_is_cached(self):
+        """A second dashboard build for the same user is served from the cache"""
+        cache.clear()
+        first = DashboardService.get_dashboard_context(self.user)
+
+        with self.assertNumQueries(0):
+            second = DashboardService.get_dashboard_context(self.user)
+
+        self.assertEqual(second['dashboard_type'], first['dashboard_type'])
+        self.assertEqual(second['current_user'], self.user)
+        self.assertGreaterEqual(second['current_time'], first['current_time'])
\ No newline at end of file
@@ -4,13 +4,13 @@ Tests for core functionality with actual service interfaces
 """
 
 from datetime import datetime, timedelta
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from django.contrib.auth import get_user_model
 
 from apps.teams.models import Team, TeamMembership, TeamRole
 from apps.scheduling.models import ShiftCategory, ShiftTemplate, ShiftInstance, PlanningPeriod
 from apps.assignments.models import Assignment
-from apps.accounts.models import SkillCategory, Skill, UserSkill
+from apps.accounts.models import UserSkill
 from apps.leave_management.models import LeaveType, LeaveRequest
 
 from core.services.fairness_service import FairnessService
@@ -19,39 +19,51 @@ from core.services.skills_service import SkillsService
 from core.services.validation_service import ValidationService
 from core.services.planning_orchestrator import PlanningOrchestrator
 from core.config import config_manager
+from tests.mixins import SkillFixtureMixin
 
 User = get_user_model()
 
+# Test user details, generated from the configuration once at import
+TEST_USER_SPECS = tuple(
+    {
+        'username': username,
+        'email': config_manager.generate_test_email(username),
+        'first_name': first_name,
+        'last_name': last_name,
+        'employee_id': config_manager.generate_employee_id(sequence),
+    }
+    for sequence, (username, first_name, last_name) in enumerate(
+        (("testuser1", "John", "Doe"), ("testuser2", "Jane", "Smith")), start=1
+    )
+)
+
 
 class IntegrationTestCase(TestCase):
-    """Base integration test case with common setup"""
+    """
+    Base integration test case with common setup
+
+    Fixtures are created once per class in setUpTestData, inside TestCase's
+    class-wide transaction; each test only pays for a savepoint rollback, so
+    read-only subclasses should stay on TestCase rather than TransactionTestCase.
+    """
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test data for integration tests"""
         # Create test team
-        self.team = Team.objects.create(
+        cls.team = Team.objects.create(
             name="Integration Test Team",
             description="Team for integration testing"
         )
         
-        # Create test users using configuration
-        self.user1 = User.objects.create_user(
-            username="testuser1",
-            email=config_manager.generate_test_email("testuser1"),
-            first_name="John", 
-            last_name="Doe",
-            employee_id=config_manager.generate_employee_id(1)
-        )
-        self.user2 = User.objects.create_user(
-            username="testuser2",
-            email=config_manager.generate_test_email("testuser2"),
-            first_name="Jane",
-            last_name="Smith",
-            employee_id=config_manager.generate_employee_id(2)
-        )
+        # Create test users using configuration, in one INSERT
+        users = [User(**spec) for spec in TEST_USER_SPECS]
+        for user in users:
+            user.set_unusable_password()
+        cls.user1, cls.user2 = User.objects.bulk_create(users)
         
         # Create team role and memberships
-        self.engineer_role, created = TeamRole.objects.get_or_create(
+        cls.engineer_role, created = TeamRole.objects.get_or_create(
             name="member",
             defaults={
                 "description": "Team member role",
@@ -61,21 +73,13 @@ class IntegrationTestCase(TestCase):
             }
         )
         
-        TeamMembership.objects.create(
-            team=self.team,
-            user=self.user1,
-            role=self.engineer_role,
-            is_active=True
-        )
-        TeamMembership.objects.create(
-            team=self.team,
-            user=self.user2,
-            role=self.engineer_role,
-            is_active=True
-        )
+        TeamMembership.objects.bulk_create([
+            TeamMembership(team=cls.team, user=user, role=cls.engineer_role, is_active=True)
+            for user in users
+        ])
         
         # Create shift category
-        self.waakdienst_category = ShiftCategory.objects.create(
+        cls.waakdienst_category = ShiftCategory.objects.create(
             name="WAAKDIENST",
             display_name="24/7 On-call Coverage",
             description="Waakdienst shifts",
@@ -85,9 +89,9 @@ class IntegrationTestCase(TestCase):
         )
         
         # Create shift template
-        self.waakdienst_template = ShiftTemplate.objects.create(
+        cls.waakdienst_template = ShiftTemplate.objects.create(
             name="Waakdienst Week",
-            category=self.waakdienst_category,
+            category=cls.waakdienst_category,
             description="Weekly waakdienst shift",
             start_time="08:00:00",
             end_time="08:00:00",
@@ -96,12 +100,27 @@ class IntegrationTestCase(TestCase):
         )
         
         # Create planning period
-        self.planning_period = PlanningPeriod.objects.create(
+        cls.planning_period = PlanningPeriod.objects.create(
             name="Test Planning Period",
+            period_type="quarterly",
             start_date=datetime(2025, 1, 1).date(),
             end_date=datetime(2025, 3, 31).date(),
-            team=self.team
+            planning_deadline=datetime(2024, 12, 15, 17, 0),
         )
+        cls.planning_period.teams.add(cls.team)
+
+    @classmethod
+    def _make_shift(cls, **overrides):
+        """Create a planned waakdienst shift for the first week of January 2025"""
+        defaults = dict(
+            template=cls.waakdienst_template,
+            date=datetime(2025, 1, 8).date(),
+            start_datetime=datetime(2025, 1, 8, 8, 0),
+            end_datetime=datetime(2025, 1, 15, 8, 0),
+            status="PLANNED"
+        )
+        defaults.update(overrides)
+        return ShiftInstance.objects.create(**defaults)
 
 
 class ServiceInitializationTest(IntegrationTestCase):
@@ -110,19 +129,16 @@ class ServiceInitializationTest(IntegrationTestCase):
     def test_fairness_service_initialization(self):
         """Test FairnessService can be initialized"""
         service = FairnessService(self.team)
-        self.assertIsNotNone(service)
         self.assertEqual(service.team, self.team)
     
     def test_assignment_service_initialization(self):
         """Test AssignmentService can be initialized"""
         service = AssignmentService(self.team)
-        self.assertIsNotNone(service)
         self.assertEqual(service.team, self.team)
     
     def test_skills_service_initialization(self):
         """Test SkillsService can be initialized"""
         service = SkillsService(self.team)
-        self.assertIsNotNone(service)
         self.assertEqual(service.team, self.team)
     
     def test_validation_service_initialization(self):
@@ -133,7 +149,6 @@ class ServiceInitializationTest(IntegrationTestCase):
     def test_planning_orchestrator_initialization(self):
         """Test PlanningOrchestrator can be initialized"""
         orchestrator = PlanningOrchestrator(self.team)
-        self.assertIsNotNone(orchestrator)
         self.assertEqual(orchestrator.team, self.team)
 
 
@@ -147,19 +162,15 @@ class FairnessServiceIntegrationTest(IntegrationTestCase):
     def test_fairness_score_calculation(self):
         """Test basic fairness score calculation"""
         # Create a shift instance
-        shift_instance = ShiftInstance.objects.create(
-            template=self.waakdienst_template,
-            start_datetime=datetime(2025, 1, 8, 8, 0),
-            end_datetime=datetime(2025, 1, 15, 8, 0),
-            status="PLANNED"
-        )
+        shift_instance = self._make_shift()
         
-        # Calculate fairness score
-        score = self.fairness_service.calculate_fairness_score(
-            self.user1, shift_instance,
-            self.planning_period.start_date,
-            self.planning_period.end_date
-        )
+        # Calculate fairness score; each factor is a single aggregate query
+        with self.assertNumQueries(6):
+            score = self.fairness_service.calculate_fairness_score(
+                self.user1, shift_instance,
+                self.planning_period.start_date,
+                self.planning_period.end_date
+            )
         
         # Verify score is calculated
         self.assertIsInstance(score, float)
@@ -188,7 +199,7 @@ class DatabaseConnectivityTest(IntegrationTestCase):
     
     def test_shift_template_creation(self):
         """Test shift templates can be created"""
-        templates = ShiftTemplate.objects.filter(team=self.team)
+        templates = ShiftTemplate.objects.filter(category=self.waakdienst_category)
         self.assertEqual(templates.count(), 1)
         
         template = templates.first()
@@ -201,12 +212,7 @@ class ShiftInstanceCreationTest(IntegrationTestCase):
     
     def test_shift_instance_creation(self):
         """Test creating shift instances"""
-        shift = ShiftInstance.objects.create(
-            template=self.waakdienst_template,
-            start_datetime=datetime(2025, 1, 8, 8, 0),
-            end_datetime=datetime(2025, 1, 15, 8, 0),
-            status="PLANNED"
-        )
+        shift = self._make_shift()
         
         self.assertIsNotNone(shift.id)
         self.assertEqual(shift.template, self.waakdienst_template)
@@ -214,45 +220,32 @@ class ShiftInstanceCreationTest(IntegrationTestCase):
     
     def test_assignment_creation(self):
         """Test creating assignments"""
-        shift = ShiftInstance.objects.create(
-            template=self.waakdienst_template,
-            start_datetime=datetime(2025, 1, 8, 8, 0),
-            end_datetime=datetime(2025, 1, 15, 8, 0),
-            status="PLANNED"
-        )
+        shift = self._make_shift()
         
         assignment = Assignment.objects.create(
-            shift_instance=shift,
+            shift=shift,
             user=self.user1,
-            status="PENDING"
+            status="pending_confirmation"
         )
         
         self.assertIsNotNone(assignment.id)
         self.assertEqual(assignment.user, self.user1)
-        self.assertEqual(assignment.shift_instance, shift)
+        self.assertEqual(assignment.shift, shift)
 
 
-class SkillsIntegrationTest(IntegrationTestCase):
+class SkillsIntegrationTest(SkillFixtureMixin, IntegrationTestCase):
     """Test skills system integration"""
+    skill_category_name = "Technical Skills"
+    skill_name = "waakdienst_certified"
     
-    def setUp(self):
-        super().setUp()
-        # Create skill category and skills
-        self.skill_category = SkillCategory.objects.create(
-            name="Technical Skills",
-            description="Engineering skills"
-        )
-        
-        self.waakdienst_skill = Skill.objects.create(
-            name="waakdienst_certified",
-            category=self.skill_category,
-            description="Waakdienst certification"
-        )
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
         
         # Assign skill to user1
         UserSkill.objects.create(
-            user=self.user1,
-            skill=self.waakdienst_skill,
+            user=cls.user1,
+            skill=cls.skill,
             proficiency_level="EXPERT"
         )
     
@@ -294,28 +287,10 @@ class SystemHealthTest(IntegrationTestCase):
         self.assertIsNotNone(validation)
         self.assertIsNotNone(orchestrator)
     
-    def test_database_models_have_expected_fields(self):
-        """Test model fields are accessible"""
-        # Test User model
-        self.assertTrue(hasattr(self.user1, 'username'))
-        self.assertTrue(hasattr(self.user1, 'email'))
-        
-        # Test Team model
-        self.assertTrue(hasattr(self.team, 'name'))
-        self.assertTrue(hasattr(self.team, 'description'))
-        
-        # Test ShiftTemplate model
-        self.assertTrue(hasattr(self.waakdienst_template, 'name'))
-        self.assertTrue(hasattr(self.waakdienst_template, 'duration_hours'))
-    
     def test_planning_period_date_handling(self):
         """Test date handling in planning periods"""
         period = self.planning_period
         
-        # Test date fields
-        self.assertIsNotNone(period.start_date)
-        self.assertIsNotNone(period.end_date)
-        
         # Test date comparison
         self.assertLess(period.start_date, period.end_date)
         
@@ -324,4 +299,19 @@ class SystemHealthTest(IntegrationTestCase):
         self.assertGreater(duration.days, 0)
 
 
-
+class ModelSchemaTest(SimpleTestCase):
+    """Test model fields exist using model metadata, without touching the database"""
+    
+    def test_database_models_have_expected_fields(self):
+        """Test model fields are declared"""
+        expected_fields = {
+            User: ('username', 'email'),
+            Team: ('name', 'description'),
+            ShiftTemplate: ('name', 'duration_hours'),
+        }
+        
+        for model, field_names in expected_fields.items():
+            for field_name in field_names:
+                with self.subTest(model=model.__name__, field=field_name):
+                    # get_field raises FieldDoesNotExist for unknown fields
+                    self.assertIsNotNone(model._meta.get_field(field_name))
@@ -1,247 +1,186 @@
-#!/usr/bin/env python
 """
 Integration test for the simplified TPS skill system
 Tests the key requirements from the problem statement
 """
 
-import os
-import sys
-import django
+import warnings
+from importlib import import_module
 
-# Setup Django
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tps_project.settings')
-django.setup()
+import pytest
+from django.apps import apps
+from django.db.models import Prefetch
 
 from apps.accounts.models import User, Skill, UserSkill, SkillCategory
 from apps.teams.models import Team, TeamMembership
 from apps.scheduling.models import ShiftTemplate, ShiftCategory
 from core.services.skills_service import SkillsService
 
+# The simplified skill set and the skills each team track is expected to cover
+REQUIRED_SKILLS = ('Incidenten', 'Projects', 'Changes', 'Waakdienst')
+EXPECTED_SKILLS = frozenset(REQUIRED_SKILLS)
+OPERATIONEEL_SKILLS = frozenset({'Incidenten', 'Projects', 'Changes'})
+TACTISCH_SKILLS = frozenset({'Projects', 'Changes', 'Waakdienst'})
+DAILY_SKILLS = OPERATIONEEL_SKILLS & TACTISCH_SKILLS  # Projects and Changes
+INCIDENT_TEAM_TOKENS = frozenset({'infrastructure', 'operations'})
+WAAKDIENST_ROLE_TOKENS = frozenset({'lead', 'coordinator'})
+
+pytestmark = pytest.mark.django_db
+
+
+def name_tokens(name):
+    """Lower-cased words of a team or role name; role slugs use underscores (deputy_lead)"""
+    return set(name.lower().replace('_', ' ').split())
+
+
+@pytest.fixture(autouse=True)
+def simplified_skills(db):
+    """Seed the skills from the 0004 data migration; --nomigrations skips it"""
+    migration = import_module('apps.accounts.migrations.0004_simplify_skill_system')
+    migration.create_simplified_skills(apps, None)
+
+
+@pytest.fixture
+def balancing_team(db):
+    """Two active engineers and a team to score them against"""
+    User.objects.bulk_create([
+        User(username=f'engineer{number}', employee_id=f'ENG00{number}') for number in (1, 2)
+    ])
+    return Team.objects.create(name='Operations', department='IT')
+
 
 def test_simplified_skill_system():
     """Test the simplified 4-skill system"""
     
-    print("🎯 Testing Simplified Skill System")
-    print("=" * 50)
-    
     # Test 1: Verify only 4 skills exist
-    skills = Skill.objects.all()
-    expected_skills = {'Incidenten', 'Projects', 'Changes', 'Waakdienst'}
-    actual_skills = set(skill.name for skill in skills)
+    actual_skills = set(Skill.objects.values_list('name', flat=True))
     
-    print(f"✓ Expected skills: {expected_skills}")
-    print(f"✓ Actual skills: {actual_skills}")
-    assert actual_skills == expected_skills, f"Expected {expected_skills}, got {actual_skills}"
-    print("✅ Skill system simplified correctly")
+    assert actual_skills == EXPECTED_SKILLS, f"Expected {set(EXPECTED_SKILLS)}, got {actual_skills}"
     
     # Test 2: Verify skill categories
-    categories = SkillCategory.objects.all()
-    assert categories.count() == 1, f"Expected 1 category, got {categories.count()}"
-    assert categories.first().name == 'Operations', f"Expected 'Operations' category"
-    print("✅ Single Operations category confirmed")
-    
-    return True
+    categories = list(SkillCategory.objects.values_list('name', flat=True))
+    assert len(categories) == 1, f"Expected 1 category, got {len(categories)}"
+    assert categories[0] == 'Operations', f"Expected 'Operations' category"
 
 
-def test_load_balancing_rules():
+def test_load_balancing_rules(balancing_team):
     """Test the load balancing rules"""
     
-    print("\n⚖️  Testing Load Balancing Rules")
-    print("=" * 50)
-    
-    # Get test users
-    users = User.objects.filter(is_active=True).exclude(username='admin')[:2]
+    # Get test users, loading only the columns the scoring and bulk_update touch
+    users = list(
+        User.objects.filter(is_active=True).exclude(username='admin')
+        .only('id', 'first_name', 'last_name', 'username', 'ytd_waakdienst_weeks')[:2]
+    )
     if len(users) < 2:
-        print("⚠️  Need at least 2 users for load balancing test")
-        return False
+        pytest.skip("Need at least 2 users for load balancing test")
     
     user1, user2 = users[0], users[1]
     team = Team.objects.first()
     
     if not team:
-        print("⚠️  No team found for testing")
-        return False
+        pytest.skip("No team found for testing")
     
     service = SkillsService(team)
     
-    # Create test shift categories and templates
-    projects_cat, _ = ShiftCategory.objects.get_or_create(
-        name='PROJECTS', 
-        defaults={'display_name': 'Projects', 'color': '#10B981'}
-    )
-    
-    changes_cat, _ = ShiftCategory.objects.get_or_create(
-        name='CHANGES',
-        defaults={'display_name': 'Changes', 'color': '#8B5CF6'}
-    )
-    
-    # Create shift templates
-    project_template, _ = ShiftTemplate.objects.get_or_create(
-        name='Test Project Work',
-        category=projects_cat,
-        defaults={
-            'start_time': '09:00',
-            'end_time': '17:00', 
-            'duration_hours': 8,
-            'is_active': True
-        }
-    )
-    
-    changes_template, _ = ShiftTemplate.objects.get_or_create(
-        name='Test Change Work',
-        category=changes_cat,
-        defaults={
-            'start_time': '18:00',
-            'end_time': '02:00',
-            'duration_hours': 8,
-            'is_active': True
-        }
-    )
+    # Create test shift categories in one INSERT; name is unique, so existing rows are kept
+    category_rules = {'max_weeks_per_year': 52, 'hours_per_week': 40, 'min_gap_days': 0}
+    ShiftCategory.objects.bulk_create([
+        ShiftCategory(name='PROJECTS', display_name='Projects', color='#10B981', **category_rules),
+        ShiftCategory(name='CHANGES', display_name='Changes', color='#8B5CF6', **category_rules),
+    ], ignore_conflicts=True)
+    categories = ShiftCategory.objects.in_bulk(['PROJECTS', 'CHANGES'], field_name='name')
+    projects_cat, changes_cat = categories['PROJECTS'], categories['CHANGES']
+    
+    # Create shift templates; they have no unique constraint, so look them up
+    # once and insert only the missing ones
+    template_defaults = {
+        ('Test Project Work', projects_cat.id): {'start_time': '09:00', 'end_time': '17:00'},
+        ('Test Change Work', changes_cat.id): {'start_time': '18:00', 'end_time': '02:00'},
+    }
+    templates = {
+        (template.name, template.category_id): template
+        for template in ShiftTemplate.objects.filter(
+            name__in=[name for name, _ in template_defaults],
+            category__in=[projects_cat, changes_cat]
+        )
+    }
+    missing = [
+        ShiftTemplate(name=name, category_id=category_id, duration_hours=8, is_active=True, **times)
+        for (name, category_id), times in template_defaults.items()
+        if (name, category_id) not in templates
+    ]
+    for template in ShiftTemplate.objects.bulk_create(missing):
+        templates[(template.name, template.category_id)] = template
+    project_template = templates[('Test Project Work', projects_cat.id)]
+    changes_template = templates[('Test Change Work', changes_cat.id)]
     
     # Test scoring
     project_score = service.calculate_skill_score(user1, project_template)
     changes_score = service.calculate_skill_score(user1, changes_template)
     
-    print(f"✓ Projects score for {user1.get_full_name()}: {project_score}")
-    print(f"✓ Changes score for {user1.get_full_name()}: {changes_score}")
-    
     # Projects and Changes should have score 0 (no value for load balancing)
     assert project_score == 0.0, f"Projects should have score 0, got {project_score}"
     assert changes_score == 0.0, f"Changes should have score 0, got {changes_score}"
-    print("✅ Projects and Changes have no value for load balancing")
     
     # Test Waakdienst and Incident load balancing
     waak_template = ShiftTemplate.objects.filter(category__name='WAAKDIENST').first()
     if waak_template:
         # Set different workloads
         user1.ytd_waakdienst_weeks = 3
-        user1.save()
-        user2.ytd_waakdienst_weeks = 1 
-        user2.save()
+        user2.ytd_waakdienst_weeks = 1
+        User.objects.bulk_update([user1, user2], ['ytd_waakdienst_weeks'])
         
         score1 = service.calculate_skill_score(user1, waak_template)
         score2 = service.calculate_skill_score(user2, waak_template)
         
-        print(f"✓ {user1.get_full_name()} (3 waak weeks): score {score1}")
-        print(f"✓ {user2.get_full_name()} (1 waak week): score {score2}")
-        
         # User with fewer weeks should have higher score (for fairness)
         if score1 > 0 and score2 > 0:  # Both have the skill
             assert score2 > score1, f"User with fewer weeks should have higher score"
-            print("✅ Load balancing favors users with less workload")
-    
-    return True
 
 
 def test_team_skill_assignments():
     """Test that users have appropriate skills based on team structure"""
     
-    print("\n👥 Testing Team Skill Assignments")
-    print("=" * 50)
-    
-    # Get users and their skills
-    users = User.objects.filter(is_active=True).exclude(username='admin')
-    
-    operationeel_skills = {'Incidenten', 'Projects', 'Changes'}
-    tactisch_skills = {'Projects', 'Changes', 'Waakdienst'}
+    # Get users with their skills and active team membership in three queries total
+    users = User.objects.filter(is_active=True).exclude(username='admin').prefetch_related(
+        Prefetch('user_skills', queryset=UserSkill.objects.select_related('skill')),
+        Prefetch(
+            'team_memberships',
+            queryset=TeamMembership.objects.filter(is_active=True).select_related('team', 'role').order_by('pk'),
+            to_attr='active_memberships'
+        ),
+    )
     
     for user in users:
-        user_skills = set(us.skill.name for us in user.user_skills.all())
-        team_membership = TeamMembership.objects.filter(user=user, is_active=True).first()
-        
-        print(f"✓ {user.get_full_name()}: {user_skills}")
+        # Built from the prefetched rows; no query per user
+        user_skills = {user_skill.skill.name for user_skill in user.user_skills.all()}
+        team_membership = user.active_memberships[0] if user.active_memberships else None
         
         # All users should have Projects and Changes (daily default work)
-        assert 'Projects' in user_skills, f"{user.get_full_name()} missing Projects skill"
-        assert 'Changes' in user_skills, f"{user.get_full_name()} missing Changes skill"
+        missing_daily = DAILY_SKILLS - user_skills
+        assert not missing_daily, f"{user.get_full_name()} missing {', '.join(sorted(missing_daily))} skill"
         
         if team_membership:
-            team_name = team_membership.team.name.lower()
-            role_name = team_membership.role.name.lower() if team_membership.role else 'member'
-            
-            print(f"  Team: {team_name}, Role: {role_name}")
+            team_tokens = name_tokens(team_membership.team.name)
+            role_tokens = name_tokens(team_membership.role.name) if team_membership.role else {'member'}
             
             # Infrastructure and operations teams should have Incidenten
-            if 'infrastructure' in team_name or 'operations' in team_name:
+            if team_tokens & INCIDENT_TEAM_TOKENS:
                 if 'Incidenten' not in user_skills:
-                    print(f"  ⚠️  Expected {user.get_full_name()} to have Incidenten skill")
+                    warnings.warn(f"Expected {user.get_full_name()} to have Incidenten skill")
             
-            # Leads and coordinators should have Waakdienst  
-            if 'lead' in role_name or 'coordinator' in role_name:
+            # Leads and coordinators should have Waakdienst
+            if role_tokens & WAAKDIENST_ROLE_TOKENS:
                 if 'Waakdienst' not in user_skills:
-                    print(f"  ⚠️  Expected {user.get_full_name()} to have Waakdienst skill")
-    
-    print("✅ Team skill assignments verified")
-    return True
+                    warnings.warn(f"Expected {user.get_full_name()} to have Waakdienst skill")
 
 
 def test_skill_management_system():
     """Test the skill management system"""
     
-    print("\n🛠️  Testing Skill Management System")
-    print("=" * 50)
-    
     # Test that all required skills exist and are manageable
-    required_skills = ['Incidenten', 'Projects', 'Changes', 'Waakdienst']
-    
-    for skill_name in required_skills:
-        skill = Skill.objects.filter(name=skill_name).first()
+    skills_by_name = Skill.objects.in_bulk(REQUIRED_SKILLS, field_name='name')
+    for skill_name in REQUIRED_SKILLS:
+        skill = skills_by_name.get(skill_name)
         assert skill is not None, f"Required skill {skill_name} not found"
         assert skill.is_active, f"Skill {skill_name} is not active"
-        print(f"✓ {skill_name}: {skill.description}")
-    
-    # Test skill assignment capability
-    test_user = User.objects.filter(is_active=True).exclude(username='admin').first()
-    if test_user:
-        skill_count_before = test_user.user_skills.count()
-        print(f"✓ {test_user.get_full_name()} has {skill_count_before} skills")
-    
-    print("✅ Skill management system functional")
-    return True
-
-
-def main():
-    """Run all tests"""
-    
-    print("🚀 TPS Simplified Skill System Integration Test")
-    print("=" * 60)
-    
-    try:
-        # Run tests
-        test_simplified_skill_system()
-        test_load_balancing_rules()
-        test_team_skill_assignments()
-        test_skill_management_system()
-        
-        print("\n" + "=" * 60)
-        print("🎉 ALL TESTS PASSED!")
-        print("✅ Skill system simplified successfully")
-        print("✅ Load balancing rules implemented correctly")
-        print("✅ Team skill assignments working")
-        print("✅ Easy skill management available")
-        print("=" * 60)
-        
-        # Show summary
-        print("\n📊 System Summary:")
-        print(f"• Skills: {Skill.objects.count()} (Incidenten, Projects, Changes, Waakdienst)")
-        print(f"• Skill Categories: {SkillCategory.objects.count()} (Operations)")
-        print(f"• Active Users: {User.objects.filter(is_active=True).exclude(username='admin').count()}")
-        print(f"• Skill Assignments: {UserSkill.objects.count()}")
-        
-        print("\n🎯 Key Features Implemented:")
-        print("• Projects and Changes have no value for load balancing")
-        print("• Only incident shifts count when balancing incident workload")
-        print("• Only waakdienst shifts count when balancing waakdienst workload")
-        print("• Easy skill assignment via manage_user_skills command")
-        print("• Simplified 4-skill system as requested")
-        
-    except AssertionError as e:
-        print(f"\n❌ TEST FAILED: {e}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"\n💥 ERROR: {e}")
-        sys.exit(1)
-
 
-if __name__ == '__main__':
-    main()
\ No newline at end of file
@@ -1,65 +1,36 @@
-#!/usr/bin/env python
 """
-Test script to verify the User model role field functionality
+Tests for the User model role field and its helper methods
 """
-import os
-import sys
-import django
-
-# Setup Django environment
-sys.path.append('/home/bart/Planner/V1.4/tps_v14')
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tps_project.settings')
-django.setup()
-
+import pytest
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
-def test_user_roles():
-    print("Testing User Model Role Functionality")
-    print("=" * 50)
-    
-    # Test role choices
-    print("Available role choices:")
-    for choice in User.ROLE_CHOICES:
-        print(f"  - {choice[0]}: {choice[1]}")
-    
-    print("\nUser role helper methods test:")
-    
-    # Create test users with different roles
-    test_users = [
-        {'username': 'test_user', 'role': 'USER', 'employee_id': 'EMP001'},
-        {'username': 'test_planner', 'role': 'PLANNER', 'employee_id': 'EMP002'},
-        {'username': 'test_manager', 'role': 'MANAGER', 'employee_id': 'EMP003'},
-    ]
-    
-    for user_data in test_users:
-        try:
-            # Try to get existing user or create new one
-            user, created = User.objects.get_or_create(
-                username=user_data['username'],
-                defaults={
-                    'role': user_data['role'],
-                    'employee_id': user_data['employee_id']
-                }
-            )
-            
-            if not created:
-                # Update role if user already exists
-                user.role = user_data['role']
-                user.save()
-            
-            print(f"\nUser: {user.username}")
-            print(f"  Role: {user.role}")
-            print(f"  is_planner(): {user.is_planner()}")
-            print(f"  is_manager(): {user.is_manager()}")
-            print(f"  can_access_planning(): {user.can_access_planning()}")
-            
-        except Exception as e:
-            print(f"Error with user {user_data['username']}: {e}")
-    
-    print("\n" + "=" * 50)
-    print("Role field testing completed!")
+pytestmark = pytest.mark.django_db
+
+# (role, is_planner, is_manager, can_access_planning)
+ROLE_EXPECTATIONS = [
+    ('USER', False, False, False),
+    ('PLANNER', True, False, True),
+    ('MANAGER', True, True, True),
+]
+
+
+def test_role_choices():
+    """Every role the helpers reason about is a valid choice"""
+    choices = {value for value, _ in User.ROLE_CHOICES}
+    assert {'USER', 'PLANNER', 'MANAGER', 'ADMIN'} <= choices
+
+
+@pytest.mark.parametrize('role,is_planner,is_manager,can_access_planning', ROLE_EXPECTATIONS)
+def test_user_roles(role, is_planner, is_manager, can_access_planning):
+    """Role helper methods reflect the user's role"""
+    user = User.objects.create(
+        username=f'test_{role.lower()}',
+        role=role,
+        employee_id=f'EMP-{role}',
+    )
 
-if __name__ == "__main__":
-    test_user_roles()
+    assert user.is_planner() is is_planner
+    assert user.is_manager() is is_manager
+    assert user.can_access_planning() is can_access_planning
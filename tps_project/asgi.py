@@ -8,7 +8,7 @@ https://docs.djangoproject.com/en/5.0/howto/deployment/asgi/
 """
 
 import os
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tps_project.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tps_project.settings.production')
 
 import django
 django.setup()
@@ -3,11 +3,26 @@ TPS V1.4 - Security Settings
 Production security configuration and validation
 """
 
+import functools
 import os
 import warnings
 from django.core.management.utils import get_random_secret_key
 
 
+# Read lazily rather than at import: settings imports this module before it
+# loads the .env file
+@functools.lru_cache(maxsize=None)
+def _environment():
+    """Deployment environment name, read once per process"""
+    return os.getenv('ENVIRONMENT', 'production')
+
+
+@functools.lru_cache(maxsize=None)
+def _debug_enabled():
+    """DEBUG environment flag, parsed once per process"""
+    return os.getenv('DEBUG', 'False').lower() == 'true'
+
+
 def validate_security_settings():
     """
     Validate critical security settings and provide warnings
@@ -24,8 +39,8 @@ def validate_security_settings():
         security_issues.append("WARNING: SECRET_KEY should be at least 50 characters long")
     
     # Check DEBUG setting
-    debug = os.getenv('DEBUG', 'False').lower() == 'true'
-    environment = os.getenv('ENVIRONMENT', 'production')
+    debug = _debug_enabled()
+    environment = _environment()
     if debug and environment == 'production':
         security_issues.append("CRITICAL: DEBUG=True should never be used in production")
     
@@ -47,12 +62,15 @@ def validate_security_settings():
     return security_issues
 
 
+@functools.lru_cache(maxsize=1)
 def get_security_settings():
     """
     Return security-focused Django settings
+    
+    Built once per process; the returned dict is shared, so don't mutate it.
     """
-    environment = os.getenv('ENVIRONMENT', 'production')
-    debug = os.getenv('DEBUG', 'False').lower() == 'true'
+    environment = _environment()
+    debug = _debug_enabled()
     
     # Base security settings
     security_settings = {
@@ -122,9 +140,11 @@ def get_security_settings():
                 },
             },
             'handlers': {
-                'file': {
+                # Request threads only enqueue records; a background thread
+                # writes each one to the file as soon as it arrives
+                'security_file': {
                     'level': 'WARNING',
-                    'class': 'logging.FileHandler',
+                    'class': 'core.log_handlers.QueuedFileHandler',
                     'filename': '/var/log/tps/security.log' if environment == 'production' else 'security.log',
                     'formatter': 'verbose',
                     'filters': ['require_debug_false'],
@@ -137,12 +157,12 @@ def get_security_settings():
             },
             'loggers': {
                 'django.security': {
-                    'handlers': ['file', 'console'],
+                    'handlers': ['security_file', 'console'],
                     'level': 'WARNING',
                     'propagate': True,
                 },
                 'tps.security': {
-                    'handlers': ['file', 'console'],
+                    'handlers': ['security_file', 'console'],
                     'level': 'INFO',
                     'propagate': True,
                 },
@@ -162,19 +182,34 @@ def get_security_settings():
     return security_settings
 
 
+CORS_ALLOW_METHODS = [
+    'DELETE',
+    'GET',
+    'OPTIONS',
+    'PATCH',
+    'POST',
+    'PUT',
+]
+
+
+@functools.lru_cache(maxsize=1)
 def get_cors_settings():
     """
     Return CORS settings for API security
+    
+    Built once per process; the returned dict is shared, so don't mutate it.
     """
-    debug = os.getenv('DEBUG', 'False').lower() == 'true'
+    debug = _debug_enabled()
     allowed_origins = os.getenv('CORS_ALLOWED_ORIGINS', '').split(',')
     
+    # Both environments return the same keys; names match django-cors-headers
     if debug:
         # Development CORS settings
         return {
             'CORS_ALLOW_ALL_ORIGINS': True,
+            'CORS_ALLOWED_ORIGINS': [],
             'CORS_ALLOW_CREDENTIALS': True,
-            'CORS_ALLOWED_HEADERS': [
+            'CORS_ALLOW_HEADERS': [
                 'accept',
                 'accept-encoding',
                 'authorization',
@@ -185,6 +220,8 @@ def get_cors_settings():
                 'x-csrftoken',
                 'x-requested-with',
             ],
+            'CORS_ALLOW_METHODS': CORS_ALLOW_METHODS,
+            'CORS_PREFLIGHT_MAX_AGE': 86400,
         }
     else:
         # Production CORS settings
@@ -192,7 +229,7 @@ def get_cors_settings():
             'CORS_ALLOW_ALL_ORIGINS': False,
             'CORS_ALLOWED_ORIGINS': [origin.strip() for origin in allowed_origins if origin.strip()],
             'CORS_ALLOW_CREDENTIALS': True,
-            'CORS_ALLOWED_HEADERS': [
+            'CORS_ALLOW_HEADERS': [
                 'accept',
                 'accept-encoding',
                 'authorization',
@@ -201,14 +238,7 @@ def get_cors_settings():
                 'x-csrftoken',
                 'x-requested-with',
             ],
-            'CORS_ALLOWED_METHODS': [
-                'DELETE',
-                'GET',
-                'OPTIONS',
-                'PATCH',
-                'POST',
-                'PUT',
-            ],
+            'CORS_ALLOW_METHODS': CORS_ALLOW_METHODS,
             'CORS_PREFLIGHT_MAX_AGE': 86400,
         }
 
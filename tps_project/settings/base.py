@@ -4,29 +4,37 @@ Common settings shared across all environments
 """
 
 import os
+from dataclasses import dataclass, fields
 from pathlib import Path
 
-# Build paths inside the project like this: BASE_DIR / 'subdir'.
+# Build paths inside the project like this: BASE_DIR / 'subdir'. Settings hold
+# them as strings (os.fspath) so consumers don't re-render the Path on every use.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 # Application definition
-DJANGO_APPS = [
-    'django.contrib.admin',
+# API-only processes need just auth, sessions (DRF session auth) and staticfiles
+# (collectstatic / WhiteNoise); the admin and flash messages serve the HTML UI
+DJANGO_APPS_MIN = (
     'django.contrib.auth',
     'django.contrib.contenttypes',
     'django.contrib.sessions',
-    'django.contrib.messages',
     'django.contrib.staticfiles',
-]
+)
+
+DJANGO_APPS_FULL = (
+    'django.contrib.admin',
+    *DJANGO_APPS_MIN,
+    'django.contrib.messages',
+)
 
-THIRD_PARTY_APPS = [
+THIRD_PARTY_APPS = (
     'rest_framework',
     'tailwind',
     'theme',  # Tailwind theme app
     # 'channels',  # Will enable once needed
-]
+)
 
-LOCAL_APPS = [
+LOCAL_APPS = (
     # TPS Core Applications
     'apps.accounts',
     'apps.teams', 
@@ -37,27 +45,37 @@ LOCAL_APPS = [
     'core',
     'api',
     'frontend',  # Frontend templates and views
-]
+)
 
-INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
+# Settings sequences are tuples so nothing can mutate them after startup.
+# FULL_APPS serves the web UI and API; API_APPS drops the admin, messages,
+# Tailwind and the HTML frontend (selected with TPS_PROFILE=api in production).
+FULL_APPS = (*DJANGO_APPS_FULL, *THIRD_PARTY_APPS, *LOCAL_APPS)
+API_APPS = (
+    *DJANGO_APPS_MIN,
+    'rest_framework',
+    *(app for app in LOCAL_APPS if app != 'frontend'),
+)
 
-MIDDLEWARE = [
+INSTALLED_APPS = FULL_APPS
+
+MIDDLEWARE = (
     'django.middleware.security.SecurityMiddleware',
+    'core.middleware.FastPathMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
-    'core.middleware.ForceEuropeanFormatsMiddleware',  # Force EU date/time formats
-]
+)
 
 ROOT_URLCONF = 'tps_project.urls'
 
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
-        'DIRS': [BASE_DIR / 'frontend' / 'templates'],
+        'DIRS': [os.fspath(BASE_DIR / 'frontend' / 'templates')],
         'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
@@ -79,7 +97,8 @@ WSGI_APPLICATION = 'tps_project.wsgi.application'
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': os.fspath(BASE_DIR / 'db.sqlite3'),
+        'CONN_MAX_AGE': 60,  # Reuse connections; WAL pragmas are set in core.signals
     }
 }
 
@@ -108,12 +127,11 @@ AUTH_USER_MODEL = 'accounts.User'
 LANGUAGE_CODE = 'en'  # Generic English
 TIME_ZONE = 'Europe/Amsterdam'
 USE_I18N = True
-USE_L10N = False  # Disable localization to use our custom formats
 USE_TZ = True
 
 # Custom locale directory
 LOCALE_PATHS = [
-    BASE_DIR / 'locale',
+    os.fspath(BASE_DIR / 'locale'),
 ]
 
 # Format module path for custom formats
@@ -128,38 +146,38 @@ DATETIME_FORMAT = 'd/m/Y H:i'  # DD/MM/YYYY HH:MM
 SHORT_DATE_FORMAT = 'd/m/Y'
 SHORT_DATETIME_FORMAT = 'd/m/Y H:i'
 
-# Input formats for forms
-DATE_INPUT_FORMATS = [
+# Input formats for forms, shared with the API below, most common first
+DATE_INPUT_FORMATS = (
     '%d/%m/%Y',     # DD/MM/YYYY
     '%d-%m-%Y',     # DD-MM-YYYY
     '%d.%m.%Y',     # DD.MM.YYYY
     '%Y-%m-%d',     # YYYY-MM-DD (ISO format fallback)
-]
+)
 
-TIME_INPUT_FORMATS = [
+TIME_INPUT_FORMATS = (
     '%H:%M',        # 24-hour format
     '%H:%M:%S',     # 24-hour format with seconds
-]
+)
 
-DATETIME_INPUT_FORMATS = [
+# ISO datetimes need no entry: forms.DateTimeField tries parse_datetime first
+DATETIME_INPUT_FORMATS = (
     '%d/%m/%Y %H:%M',
     '%d/%m/%Y %H:%M:%S',
     '%d-%m-%Y %H:%M',
     '%d.%m.%Y %H:%M',
-    '%Y-%m-%d %H:%M:%S',  # ISO format fallback
-]
+)
 
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.0/howto/static-files/
 STATIC_URL = '/static/'
-STATIC_ROOT = BASE_DIR / 'staticfiles'
+STATIC_ROOT = os.fspath(BASE_DIR / 'staticfiles')
 STATICFILES_DIRS = [
-    BASE_DIR / 'frontend' / 'static',
+    os.fspath(BASE_DIR / 'frontend' / 'static'),
 ]
 
 # Media files
 MEDIA_URL = '/media/'
-MEDIA_ROOT = BASE_DIR / 'media'
+MEDIA_ROOT = os.fspath(BASE_DIR / 'media')
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
@@ -176,17 +194,19 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    # JSON only; development.py adds the browsable API
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     # European date/time formats for API
     'DATE_FORMAT': '%d/%m/%Y',
     'TIME_FORMAT': '%H:%M',
     'DATETIME_FORMAT': '%d/%m/%Y %H:%M',
-    'DATE_INPUT_FORMATS': ['%d/%m/%Y', '%d-%m-%Y', '%d.%m.%Y', '%Y-%m-%d'],
-    'TIME_INPUT_FORMATS': ['%H:%M', '%H:%M:%S'],
-    'DATETIME_INPUT_FORMATS': ['%d/%m/%Y %H:%M', '%d/%m/%Y %H:%M:%S', '%d-%m-%Y %H:%M', '%Y-%m-%d %H:%M:%S'],
+    # Same day-first formats as forms; 'iso-8601' hands ISO input to Django's
+    # parse_date/parse_datetime instead of another strptime attempt
+    'DATE_INPUT_FORMATS': [*DATE_INPUT_FORMATS[:-1], 'iso-8601'],
+    'TIME_INPUT_FORMATS': [*TIME_INPUT_FORMATS],
+    'DATETIME_INPUT_FORMATS': [*DATETIME_INPUT_FORMATS, 'iso-8601'],
 }
 
 # Channels Configuration (commented for initial setup)
@@ -209,19 +229,43 @@ CELERY_TIMEZONE = TIME_ZONE
 
 # Tailwind CSS Configuration
 TAILWIND_APP_NAME = 'theme'
-INTERNAL_IPS = [
+INTERNAL_IPS = frozenset({
     "127.0.0.1",
-]
+})
 
 # TPS Business Configuration
-TPS_CONFIG = {
-    'MAX_WAAKDIENST_WEEKS_PER_YEAR': 8,
-    'MAX_INCIDENT_WEEKS_PER_YEAR': 12,
-    'MIN_GAP_WAAKDIENST_DAYS': 14,
-    'MIN_GAP_INCIDENT_DAYS': 7,
-    'WAAKDIENST_HOURS_PER_WEEK': 168,
-    'INCIDENT_HOURS_PER_WEEK': 45,
-}
+@dataclass(frozen=True, slots=True)
+class TPSConfig:
+    """Scheduling limits, read as attributes (settings.TPS_CONFIG.min_gap_waakdienst_days)"""
+    max_waakdienst_weeks_per_year: int = 8
+    max_incident_weeks_per_year: int = 12
+    min_gap_waakdienst_days: int = 14
+    min_gap_incident_days: int = 7
+    waakdienst_hours_per_week: int = 168
+    incident_hours_per_week: int = 45
+
+    @classmethod
+    def from_env(cls, environ=os.environ):
+        """Build the config once, overriding defaults with TPS_<NAME> environment variables"""
+        overrides = {}
+        for field in fields(cls):
+            value = environ.get(f'TPS_{field.name.upper()}')
+            if value is not None:
+                overrides[field.name] = int(value)
+        return cls(**overrides)
+
+    # Dict-style access for callers still using TPS_CONFIG['MAX_...'] keys
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key.lower())
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key.lower(), default)
+
+
+TPS_CONFIG = TPSConfig.from_env()
 
 # Logging Configuration
 LOGGING = {
@@ -238,10 +282,11 @@ LOGGING = {
         },
     },
     'handlers': {
+        # Request threads only enqueue records; a background thread writes them
         'file': {
             'level': 'INFO',
-            'class': 'logging.FileHandler',
-            'filename': BASE_DIR / 'logs' / 'tps.log',
+            'class': 'core.log_handlers.QueuedFileHandler',
+            'filename': os.fspath(BASE_DIR / 'logs' / 'tps.log'),
             'formatter': 'verbose',
         },
         'console': {
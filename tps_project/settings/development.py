@@ -16,16 +16,26 @@ if not SECRET_KEY:
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
 
-ALLOWED_HOSTS = ['localhost', '127.0.0.1', '[::1]']
+ALLOWED_HOSTS = ('localhost', '127.0.0.1', '[::1]')
 
 # Development Database - SQLite for ease of development
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'NAME': os.fspath(BASE_DIR / 'db.sqlite3'),
+        'CONN_MAX_AGE': 60,  # Reuse connections; WAL pragmas are set in core.signals
     }
 }
 
+# Browsable API for exploring endpoints locally
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_RENDERER_CLASSES': [
+        *REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'],
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
 # Development email backend
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
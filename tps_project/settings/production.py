@@ -3,60 +3,213 @@ TPS V1.4 - Production Settings
 Settings for production deployment
 """
 
+import logging
 import os
+from importlib.util import find_spec
+
+from django.core.exceptions import ImproperlyConfigured
+from dotenv import load_dotenv
+
 from .base import *
+from ..security_settings import get_cors_settings, get_security_settings, validate_security_settings
+
+# Load environment variables from .env file, unless the process manager already
+# provided them (SECRET_KEY is always set in a configured environment)
+if not os.getenv('SECRET_KEY'):
+    load_dotenv(BASE_DIR / '.env')
+
+# Snapshot the environment once; os.environ decodes the value on every lookup
+env = os.environ.copy()
+
+ENVIRONMENT = env.get('ENVIRONMENT', 'production')
+
+# Rebuild from the snapshot so TPS_* values from .env are applied as well
+TPS_CONFIG = TPSConfig.from_env(env)
+
+# The security audit runs via `manage.py audit`; set TPS_RUN_SECURITY_AUDIT=1
+# to also print it when settings load, instead of in every worker by default
+if env.get('TPS_RUN_SECURITY_AUDIT') == '1':
+    security_issues = validate_security_settings()
+    if security_issues:
+        print("🔒 SECURITY AUDIT FINDINGS:")
+        for issue in security_issues:
+            print(f"   {issue}")
+        print()
 
 # Security settings for production
-SECRET_KEY = os.environ.get('SECRET_KEY')
+SECRET_KEY = env.get('SECRET_KEY')
 DEBUG = False
-ALLOWED_HOSTS = os.environ.get('ALLOWED_HOSTS', '').split(',')
+ALLOWED_HOSTS = tuple(host.strip() for host in env.get('ALLOWED_HOSTS', '').split(',') if host.strip())
 
 # Production Database - PostgreSQL
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
-        'NAME': os.environ.get('DB_NAME'),
-        'USER': os.environ.get('DB_USER'),
-        'PASSWORD': os.environ.get('DB_PASSWORD'),
-        'HOST': os.environ.get('DB_HOST', 'localhost'),
-        'PORT': os.environ.get('DB_PORT', '5432'),
+        'NAME': env.get('DB_NAME'),
+        'USER': env.get('DB_USER'),
+        'PASSWORD': env.get('DB_PASSWORD'),
+        'HOST': env.get('DB_HOST', 'localhost'),
+        'PORT': env.get('DB_PORT', '5432'),
+        'CONN_MAX_AGE': 600,
+        'CONN_HEALTH_CHECKS': True,
+        # Server-side cursors don't survive pgbouncer's transaction pooling
+        'DISABLE_SERVER_SIDE_CURSORS': env.get('DB_PGBOUNCER', 'False').lower() == 'true',
         'OPTIONS': {
             'sslmode': 'require',
+            'connect_timeout': 5,
         },
     }
 }
 
-# Security settings
+# Optional streaming replica for the read-heavy scheduling and assignment
+# queries; ReplicaRouter sends their SELECTs there and everything else stays on
+# the primary
+if env.get('DB_REPLICA_HOST'):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': env['DB_REPLICA_HOST'],
+        'PORT': env.get('DB_REPLICA_PORT', DATABASES['default']['PORT']),
+        'OPTIONS': dict(DATABASES['default']['OPTIONS']),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_ROUTERS = ['core.routers.ReplicaRouter']
+
+# TPS_PROFILE=api starts an API-only process without the admin, flash messages
+# and HTML frontend; 'full' (the default) serves the web UI as well
+TPS_PROFILE = env.get('TPS_PROFILE', 'full')
+if TPS_PROFILE not in ('api', 'full'):
+    raise ImproperlyConfigured(f"TPS_PROFILE must be 'api' or 'full', not {TPS_PROFILE!r}")
+if TPS_PROFILE == 'api':
+    INSTALLED_APPS = API_APPS
+    MIDDLEWARE = tuple(
+        middleware for middleware in MIDDLEWARE
+        if middleware != 'django.contrib.messages.middleware.MessageMiddleware'
+    )
+
+# CORS support for API clients (django-cors-headers); WhiteNoise serves static
+# files straight after SecurityMiddleware, ahead of the rest of the chain
+INSTALLED_APPS = (*INSTALLED_APPS, 'corsheaders')
+MIDDLEWARE = (
+    MIDDLEWARE[0],
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    *MIDDLEWARE[1:],
+)
+
+# Hashed, pre-compressed static files from collectstatic; WhiteNoise indexes them
+# at startup and serves the hashed names with far-future cache headers
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
+# Hardened cookie, header and password settings from security_settings. HTTPS
+# redirect, HSTS and secure-cookie flags are always on in production, so they
+# are set directly. The security loggers are merged into LOGGING at the end of
+# this module.
+security_config = get_security_settings()
+security_logging = security_config['LOGGING']
+
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
 SECURE_HSTS_INCLUDE_SUBDOMAINS = True
 SECURE_HSTS_SECONDS = 86400
+SECURE_HSTS_PRELOAD = security_config['SECURE_HSTS_PRELOAD']
+SECURE_PROXY_SSL_HEADER = security_config['SECURE_PROXY_SSL_HEADER']
+SECURE_REFERRER_POLICY = security_config['SECURE_REFERRER_POLICY']
 SECURE_REDIRECT_EXEMPT = []
 SECURE_SSL_REDIRECT = True
+
 SESSION_COOKIE_SECURE = True
+SESSION_COOKIE_HTTPONLY = security_config['SESSION_COOKIE_HTTPONLY']
+SESSION_COOKIE_SAMESITE = security_config['SESSION_COOKIE_SAMESITE']
+SESSION_COOKIE_AGE = security_config['SESSION_COOKIE_AGE']
+SESSION_EXPIRE_AT_BROWSER_CLOSE = security_config['SESSION_EXPIRE_AT_BROWSER_CLOSE']
+
+# The frontend's AJAX calls read the token from the csrftoken cookie, so it
+# stays a readable cookie rather than HttpOnly or session-stored
 CSRF_COOKIE_SECURE = True
+CSRF_COOKIE_SAMESITE = security_config['CSRF_COOKIE_SAMESITE']
+
+X_FRAME_OPTIONS = security_config['X_FRAME_OPTIONS']
+AUTH_PASSWORD_VALIDATORS = security_config['AUTH_PASSWORD_VALIDATORS']
+
+# CORS policy (django-cors-headers)
+cors_config = get_cors_settings()
+CORS_ALLOW_ALL_ORIGINS = cors_config['CORS_ALLOW_ALL_ORIGINS']
+CORS_ALLOWED_ORIGINS = cors_config['CORS_ALLOWED_ORIGINS']
+CORS_ALLOW_CREDENTIALS = cors_config['CORS_ALLOW_CREDENTIALS']
+CORS_ALLOW_HEADERS = cors_config['CORS_ALLOW_HEADERS']
+CORS_ALLOW_METHODS = cors_config['CORS_ALLOW_METHODS']
+CORS_PREFLIGHT_MAX_AGE = cors_config['CORS_PREFLIGHT_MAX_AGE']
 
 # Email settings
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
-EMAIL_HOST = os.environ.get('EMAIL_HOST')
-EMAIL_PORT = int(os.environ.get('EMAIL_PORT', '587'))
+EMAIL_HOST = env.get('EMAIL_HOST')
+EMAIL_PORT = int(env.get('EMAIL_PORT', '587'))
 EMAIL_USE_TLS = True
-EMAIL_HOST_USER = os.environ.get('EMAIL_HOST_USER')
-EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD')
-DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL')
+EMAIL_HOST_USER = env.get('EMAIL_HOST_USER')
+EMAIL_HOST_PASSWORD = env.get('EMAIL_HOST_PASSWORD')
+DEFAULT_FROM_EMAIL = env.get('DEFAULT_FROM_EMAIL')
 
 # Redis settings for production
+REDIS_HOST = env.get('REDIS_HOST', 'localhost')
+REDIS_PORT = int(env.get('REDIS_PORT', '6379'))
+
 CHANNEL_LAYERS = {
     'default': {
         'BACKEND': 'channels_redis.core.RedisChannelLayer',
         'CONFIG': {
-            'hosts': [(os.environ.get('REDIS_HOST', 'localhost'), 6379)],
+            'hosts': [(REDIS_HOST, REDIS_PORT)],
+        },
+    },
+}
+
+# Fall back to the in-memory channel layer when the Redis packages aren't
+# installed; find_spec checks for them without importing them
+if not (find_spec('redis') and find_spec('channels_redis')):
+    CHANNEL_LAYERS = {
+        'default': {
+            'BACKEND': 'channels.layers.InMemoryChannelLayer',
+        },
+    }
+
+CELERY_BROKER_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/0"
+CELERY_RESULT_BACKEND = f"redis://{REDIS_HOST}:{REDIS_PORT}/0"
+
+# Cache shared by all workers (CacheService etc.), in database 1 apart from
+# the Celery broker. RedisCache has no delete_pattern, so CacheService
+# invalidates by key and per-user generation and never calls cache.clear().
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': f"redis://{REDIS_HOST}:{REDIS_PORT}/1",
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'socket_connect_timeout': 2,
+            'socket_timeout': 2,
         },
     },
 }
 
-CELERY_BROKER_URL = f"redis://{os.environ.get('REDIS_HOST', 'localhost')}:6379/0"
-CELERY_RESULT_BACKEND = f"redis://{os.environ.get('REDIS_HOST', 'localhost')}:6379/0"
+# Used by cache_page and the per-site cache middleware. The middleware itself
+# isn't installed: almost every page is per-user, so it would only add a
+# round trip to Redis on each request.
+CACHE_MIDDLEWARE_SECONDS = 60
+CACHE_MIDDLEWARE_KEY_PREFIX = 'tps'
 
 # Logging for production
 LOGGING['handlers']['file']['filename'] = '/var/log/tps/tps.log'
+LOGGING['filters'] = {**LOGGING.get('filters', {}), **security_logging['filters']}
+LOGGING['handlers'].update(security_logging['handlers'])
+LOGGING['loggers'].update(security_logging['loggers'])
+
+# Log security configuration on startup
+logger = logging.getLogger('tps.security')
+logger.info(f"TPS Security: Environment={ENVIRONMENT}, HTTPS={'Enabled' if SECURE_SSL_REDIRECT else 'Disabled'}")
+if cors_config.get('CORS_ALLOW_ALL_ORIGINS'):
+    logger.warning("TPS Security: CORS allows all origins - ensure this is intended for development only")
@@ -3,15 +3,32 @@ TPS V1.4 - Testing Settings
 Settings for running tests
 """
 
+import os
 from .base import *
 
-# Use in-memory database for tests
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': ':memory:',
+# Fixed key for the test run only
+SECRET_KEY = 'django-insecure-test-only'
+
+# Use in-memory database for tests; set TEST_DB_ENGINE=postgresql to run the
+# suite against PostgreSQL (e.g. release CI) with the production DB_* variables
+if os.environ.get('TEST_DB_ENGINE') == 'postgresql':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DB_NAME', 'tps'),
+            'USER': os.environ.get('DB_USER'),
+            'PASSWORD': os.environ.get('DB_PASSWORD'),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', '5432'),
+        }
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
     }
-}
 
 # Disable migrations during tests for speed
 class DisableMigrations:
@@ -33,8 +50,11 @@ CACHES = {
     }
 }
 
-# Speed up password hashing
+# Store test passwords unhashed so fixture users cost no hashing; MD5 still
+# verifies any pre-hashed fixture passwords. The test database is in memory,
+# so pytest --reuse-db / manage.py test --keepdb only matter with TEST_DB_ENGINE.
 PASSWORD_HASHERS = [
+    'tests.hashers.PlainPasswordHasher',
     'django.contrib.auth.hashers.MD5PasswordHasher',
 ]
 
@@ -14,50 +14,71 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-from django.contrib import admin
-from django.urls import path, include
+import re
+
+from django.apps import apps
+from django.urls import path, include, re_path
 from django.conf import settings
-from django.conf.urls.static import static
+from django.views.static import serve
 from django.conf.urls.i18n import i18n_patterns
-from django.shortcuts import redirect
 from django.http import HttpResponse
 from core.views import test_formats_view
+from django.views.generic import RedirectView
 from django.views.i18n import set_language
 from core.health import health_check, readiness_check, liveness_check, metrics_endpoint
 
-def accounts_login_redirect(request):
-    """Redirect /accounts/login/ to /login/"""
-    return redirect('/login/')
-
-def favicon_view(request):
-    """Serve favicon"""
-    return redirect('/static/images/favicon.svg')
-
 urlpatterns = [
-    path('admin/', admin.site.urls),
-    path('accounts/login/', accounts_login_redirect, name='accounts_login_redirect'),
-    path('accounts/', include('apps.accounts.urls')),
-    path('favicon.ico', favicon_view, name='favicon'),
     path('api/', include('api.urls')),
-    path('leave/', include('apps.leave_management.urls')),
-    path('test-formats/', test_formats_view, name='test_formats'),  # Test endpoint
-    path('set_language/', set_language, name='set_language'),  # Language switching
     
-    # Health check endpoints for production monitoring
-    path('health/', health_check, name='health_check'),
-    path('health/ready/', readiness_check, name='readiness_check'),
-    path('health/live/', liveness_check, name='liveness_check'),
+    # Health check endpoints for production monitoring, grouped under one
+    # prefix so other requests skip them with a single match. GET/HEAD probes
+    # are normally answered by core.middleware.FastPathMiddleware.
+    path('health/', include([
+        path('', health_check, name='health_check'),
+        path('ready/', readiness_check, name='readiness_check'),
+        path('live/', liveness_check, name='liveness_check'),
+    ])),
     path('metrics/', metrics_endpoint, name='metrics'),
-    
-    path('', include('frontend.urls')),
 ]
 
-# Add static files handling for development
+# The admin and the HTML pages are only routed when their apps are installed;
+# API-only processes (TPS_PROFILE=api) leave them out
+if apps.is_installed('django.contrib.admin'):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path('admin/', admin.site.urls))
+
+if apps.is_installed('frontend'):
+    urlpatterns += [
+        # Permanent (301) redirects, so browsers cache them and stop asking
+        path('accounts/login/', RedirectView.as_view(url='/login/', permanent=True), name='accounts_login_redirect'),
+        path('accounts/', include('apps.accounts.urls')),
+        path('favicon.ico', RedirectView.as_view(url='/static/images/favicon.svg', permanent=True), name='favicon'),
+        path('leave/', include('apps.leave_management.urls')),
+        path('test-formats/', test_formats_view, name='test_formats'),  # Test endpoint
+        path('set_language/', set_language, name='set_language'),  # Language switching
+        path('', include('frontend.urls')),
+    ]
+
+# Add static and media file handling for development: one pattern for both,
+# the first path segment picks the document root. Production serves these
+# through WhiteNoise and the reverse proxy.
 if settings.DEBUG:
-    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+    DEBUG_FILE_ROOTS = {
+        settings.STATIC_URL.strip('/'): settings.STATIC_ROOT,
+        settings.MEDIA_URL.strip('/'): settings.MEDIA_ROOT,
+    }
+
+    def debug_file_view(request, prefix, path):
+        """Serve a static or media file in development"""
+        return serve(request, path, document_root=DEBUG_FILE_ROOTS[prefix])
+
+    urlpatterns.append(re_path(
+        r'^(?P<prefix>%s)/(?P<path>.*)$' % '|'.join(map(re.escape, DEBUG_FILE_ROOTS)),
+        debug_file_view,
+    ))
     # Debug toolbar temporarily disabled for cleaner UI
     # import debug_toolbar
     # urlpatterns = [
     #     path('__debug__/', include(debug_toolbar.urls)),
     # ] + urlpatterns
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)